@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-16 10:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('content', '0010_widen_essay_summary'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='publishlog',
+            index=models.Index(fields=['content_type', 'content_slug', '-created_at'], name='idx_publishlog_lookup'),
+        ),
+    ]
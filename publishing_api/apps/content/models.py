@@ -8,6 +8,7 @@ Site configuration models (DesignTokenSet, NavItem, PageComposition,
 SiteSettings) serialize to a single src/config/site.json file.
 """
 
+import json
 import uuid
 
 from django.db import models
@@ -110,6 +111,9 @@ class Essay(TimeStampedModel):
     def is_draft(self):
         return self.stage != self.Stage.PUBLISHED
 
+    # Serialized once for the edit page stage pipeline
+    STAGE_CHOICES_JSON = json.dumps(ESSAY_STAGES)
+
     @property
     def stage_list(self):
         return ESSAY_STAGES
@@ -166,6 +170,8 @@ class FieldNote(TimeStampedModel):
     def is_draft(self):
         return self.status != self.Status.CONNECTED
 
+    STAGE_CHOICES_JSON = json.dumps(NOTE_STAGES)
+
     @property
     def stage_list(self):
         return NOTE_STAGES
@@ -233,6 +239,8 @@ class ShelfEntry(TimeStampedModel):
     def is_draft(self):
         return self.stage != self.Stage.PUBLISHED
 
+    STAGE_CHOICES_JSON = json.dumps(SIMPLE_STAGES)
+
     @property
     def stage_list(self):
         return SIMPLE_STAGES
@@ -289,6 +297,8 @@ class Project(TimeStampedModel):
     def is_draft(self):
         return self.stage != self.Stage.PUBLISHED
 
+    STAGE_CHOICES_JSON = json.dumps(SIMPLE_STAGES)
+
     @property
     def stage_list(self):
         return SIMPLE_STAGES
@@ -343,6 +353,8 @@ class ToolkitEntry(TimeStampedModel):
     def is_draft(self):
         return self.stage != self.Stage.PUBLISHED
 
+    STAGE_CHOICES_JSON = json.dumps(SIMPLE_STAGES)
+
     @property
     def stage_list(self):
         return SIMPLE_STAGES
@@ -388,6 +400,7 @@ VIDEO_PHASES = [
     "research", "scripting", "voiceover", "filming",
     "assembly", "polish", "metadata", "publish", "published",
 ]
+VIDEO_PHASE_INDEX = {phase: i for i, phase in enumerate(VIDEO_PHASES)}
 
 
 class VideoProject(TimeStampedModel):
@@ -542,6 +555,8 @@ class VideoProject(TimeStampedModel):
     def is_draft(self):
         return self.phase != self.Phase.PUBLISHED
 
+    STAGE_CHOICES_JSON = json.dumps(VIDEO_PHASES)
+
     @property
     def stage_list(self):
         return VIDEO_PHASES
@@ -554,15 +569,13 @@ class VideoProject(TimeStampedModel):
     @property
     def phase_number(self):
         """Returns integer phase index (0 through 8)."""
-        phases = [c[0] for c in self.Phase.choices]
-        return phases.index(self.phase)
+        return VIDEO_PHASE_INDEX[self.phase]
 
     @property
     def locked_phase_number(self):
         if not self.phase_locked_through:
             return -1
-        phases = [c[0] for c in self.Phase.choices]
-        return phases.index(self.phase_locked_through)
+        return VIDEO_PHASE_INDEX[self.phase_locked_through]
 
     def can_advance(self):
         """Whether the current phase can advance (not already published)."""
@@ -576,9 +589,7 @@ class VideoProject(TimeStampedModel):
         if not self.can_advance():
             return None
         self.phase_locked_through = self.phase
-        phases = [c[0] for c in self.Phase.choices]
-        current_idx = phases.index(self.phase)
-        self.phase = phases[current_idx + 1]
+        self.phase = VIDEO_PHASES[self.phase_number + 1]
         self.save()
         return self.phase
 
@@ -588,17 +599,44 @@ class VideoProject(TimeStampedModel):
         is not locked through.
         Returns new phase string or None if cannot roll back.
         """
-        phases = [c[0] for c in self.Phase.choices]
-        current_idx = phases.index(self.phase)
+        current_idx = self.phase_number
         if current_idx <= 0:
             return None
-        prev_phase = phases[current_idx - 1]
-        if self.locked_phase_number >= phases.index(prev_phase):
+        if self.locked_phase_number >= current_idx - 1:
             return None
-        self.phase = prev_phase
+        self.phase = VIDEO_PHASES[current_idx - 1]
         self.save()
         return self.phase
 
+    def advance_phase_to(self, target):
+        """
+        Advance through every phase up to `target` in a single write,
+        locking each phase passed along the way.
+        Returns the new phase string, or None if `target` is not ahead.
+        """
+        target_idx = VIDEO_PHASE_INDEX[target]
+        if not self.can_advance() or target_idx <= self.phase_number:
+            return None
+        self.phase_locked_through = VIDEO_PHASES[target_idx - 1]
+        self.phase = target
+        self.save(update_fields=["phase", "phase_locked_through", "updated_at"])
+        return self.phase
+
+    def rollback_phase_to(self, target):
+        """
+        Roll back to `target` in a single write. Only allowed if no phase
+        between here and `target` is locked through.
+        Returns new phase string or None if cannot roll back.
+        """
+        target_idx = VIDEO_PHASE_INDEX[target]
+        if target_idx >= self.phase_number:
+            return None
+        if self.locked_phase_number >= target_idx:
+            return None
+        self.phase = target
+        self.save(update_fields=["phase", "updated_at"])
+        return self.phase
+
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
@@ -957,6 +995,12 @@ class PublishLog(TimeStampedModel):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            models.Index(
+                fields=["content_type", "content_slug", "-created_at"],
+                name="idx_publishlog_lookup",
+            ),
+        ]
 
     def __str__(self):
         status = "OK" if self.success else "FAILED"
@@ -1,3 +1,27 @@
 from django.test import TestCase
 
-# Create your tests here.
+from apps.content.models import VideoProject
+
+
+class VideoPhaseTransitionTest(TestCase):
+    def setUp(self):
+        self.video = VideoProject.objects.create(title="Test Video")
+
+    def test_advance_phase_to_locks_every_phase_passed(self):
+        self.assertEqual(self.video.advance_phase_to("filming"), "filming")
+        self.video.refresh_from_db()
+        self.assertEqual(self.video.phase, "filming")
+        self.assertEqual(self.video.phase_locked_through, "voiceover")
+
+    def test_advance_phase_to_refuses_backwards_target(self):
+        self.video.advance_phase_to("filming")
+        self.assertIsNone(self.video.advance_phase_to("scripting"))
+
+    def test_rollback_phase_to_refuses_locked_phase(self):
+        self.video.phase = "filming"
+        self.video.phase_locked_through = "scripting"
+        self.video.save()
+        self.assertIsNone(self.video.rollback_phase_to("research"))
+        self.assertEqual(self.video.rollback_phase_to("voiceover"), "voiceover")
+        self.video.refresh_from_db()
+        self.assertEqual(self.video.phase, "voiceover")
@@ -0,0 +1,18 @@
+from django.urls import include, path
+
+from apps.editor import views
+
+# Video API (JSON, for Orchestra Conductor + frontend), mounted under
+# api/videos/ by apps.editor.urls. No app_name: the names stay in the
+# "editor" namespace, e.g. editor:api-video-detail.
+urlpatterns = [
+    path("", views.VideoAPIListView.as_view(), name="api-video-list"),
+    path("<slug:slug>/", include([
+        path("", views.VideoAPIDetailView.as_view(), name="api-video-detail"),
+        path("sessions/", views.VideoAPISessionsView.as_view(), name="api-video-sessions"),
+        path("log-session/", views.VideoAPILogSessionView.as_view(), name="api-video-log-session"),
+        path("advance/", views.VideoAPIAdvanceView.as_view(), name="api-video-advance"),
+        path("deliverable/", views.VideoAPIDeliverableView.as_view(), name="api-video-deliverable"),
+        path("next-action/", views.VideoAPINextActionView.as_view(), name="api-video-next-action"),
+    ])),
+]
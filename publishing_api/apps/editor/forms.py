@@ -19,526 +19,497 @@ from apps.content.models import (
     VideoScene,
 )
 from apps.editor.widgets import (
-    ANNOTATIONS_SCHEMA,
-    CALLOUTS_SCHEMA,
-    FOOTER_LINKS_SCHEMA,
-    SOURCES_SCHEMA,
-    URLS_SCHEMA,
-    VIDEO_SOURCES_SCHEMA,
-    YOUTUBE_CHAPTERS_SCHEMA,
+    BARE_TEXTAREA_CLS,
+    DESIGN_COLORS_HINT,
+    DESIGN_FONTS_HINT,
+    DESIGN_SECTION_COLORS_HINT,
+    DESIGN_SPACING_HINT,
+    EMPTY_COMPOSITION_HINT,
+    FIELD_NOTE_COMPOSITION_HINT,
+    PAGE_SETTINGS_HINT,
+    PROJECT_COMPOSITION_HINT,
+    SITE_TOGGLES_HINT,
+    AnnotationsWidget,
+    CalloutsWidget,
     CompositionWidget,
+    EditorBodyTextarea,
+    FooterLinksWidget,
     JsonObjectListWidget,
     SlugListWidget,
-    StructuredListWidget,
+    SourcesWidget,
     TagsWidget,
+    UrlsWidget,
+    VideoSourcesWidget,
+    YoutubeChaptersWidget,
 )
 
 
+class EditorFormHelper(FormHelper):
+    """
+    Helper shared by the editor forms rendered with {% crispy %}. Layouts
+    are static, so each form declares one helper at class level and every
+    instance reuses it; crispy only reads the helper during render.
+    """
+
+    # Editor templates supply their own <form> element
+    form_tag = False
+    # Editor widgets declare no Media (studio.js loads from base.html),
+    # so skip crispy's per-widget form.media merge on every render
+    include_media = False
+
+
+# Leading fields shared by the dated content types
+_IDENTITY_FIELDS = ("title", "slug", "date")
+
+# Widgets repeated verbatim across forms. ModelForm deep-copies the widget
+# into each form field, so one instance per distinct widget is enough.
+_SLUG_WIDGET = forms.TextInput(attrs={"placeholder": "auto-generated-from-title"})
+_DATE_WIDGET = forms.DateInput(attrs={"type": "date"})
+_CALLOUT_WIDGET = forms.Textarea(attrs={
+    "rows": 2,
+    "placeholder": "Callout text. Use [link text](url) for hyperlinks.",
+})
+_CONTEXT_WIDGET = forms.Textarea(attrs={"rows": 2, "placeholder": "Context..."})
+_EDITOR_BODY_WIDGET = EditorBodyTextarea()
+_TAGS_WIDGET = TagsWidget()
+_CALLOUTS_WIDGET = CalloutsWidget()
+_COMPOSITION_WIDGET = CompositionWidget()
+
+# Each form's Meta.widgets lives at module level as _<FORM>_WIDGETS, next
+# to the form that uses it, so a single entry can be swapped without
+# redefining the form class.
+
+
+_ESSAY_WIDGETS = {
+    "title": forms.TextInput(attrs={
+        "placeholder": "Essay title...",
+        "autocomplete": "off",
+    }),
+    "slug": _SLUG_WIDGET,
+    "date": _DATE_WIDGET,
+    "summary": forms.Textarea(attrs={
+        "rows": 2,
+        "maxlength": 200,
+        "placeholder": "A brief summary (max 200 chars)...",
+    }),
+    "body": _EDITOR_BODY_WIDGET,
+    "youtube_id": forms.TextInput(attrs={"placeholder": "YouTube video ID"}),
+    "thumbnail": forms.TextInput(attrs={"placeholder": "/collage/thumbnail.png"}),
+    "image": forms.TextInput(attrs={"placeholder": "/collage/image.png"}),
+    "callout": _CALLOUT_WIDGET,
+    "stage": forms.Select(),
+    "composition": _COMPOSITION_WIDGET,
+    # JSON fields with structured widgets
+    "tags": _TAGS_WIDGET,
+    "sources": SourcesWidget(),
+    "related": SlugListWidget(attrs={"placeholder": "essay-slug-1, essay-slug-2"}),
+    "callouts": _CALLOUTS_WIDGET,
+    "annotations": AnnotationsWidget(),
+    # Process proof fields
+    "thesis": forms.Textarea(attrs={
+        "rows": 2,
+        "placeholder": "One-sentence thesis for this essay...",
+    }),
+    "research_started": _DATE_WIDGET,
+    "source_summary": forms.TextInput(attrs={
+        "placeholder": "e.g. 4 articles, 2 books, 1 interview",
+    }),
+    "connected_types": TagsWidget(attrs={
+        "placeholder": "field-note, project, shelf-entry",
+    }),
+    "research_notes": forms.Textarea(attrs={
+        "rows": 4,
+        "placeholder": "Research notes, open questions, leads...",
+    }),
+    "connection_notes": forms.Textarea(attrs={
+        "rows": 3,
+        "placeholder": "How this essay connects to other content...",
+    }),
+}
+
+
 class EssayForm(forms.ModelForm):
     class Meta:
         model = Essay
-        fields = [
-            "title",
-            "slug",
-            "date",
+        fields = _IDENTITY_FIELDS + (
             "summary",
-            "body",
+            "stage",
             "youtube_id",
             "thumbnail",
             "image",
             "tags",
-            "sources",
             "related",
-            "draft",
-            "callout",
-            "callouts",
-            "stage",
+            "sources",
             "annotations",
-            "composition",
+            "callouts",
+            "callout",
             "thesis",
             "source_count",
             "research_started",
             "revision_count",
-            "research_notes",
             "source_summary",
             "connected_types",
+            "research_notes",
             "connection_notes",
-        ]
-        widgets = {
-            "title": forms.TextInput(attrs={
-                "placeholder": "Essay title...",
-                "autocomplete": "off",
-            }),
-            "slug": forms.TextInput(attrs={
-                "placeholder": "auto-generated-from-title",
-            }),
-            "date": forms.DateInput(attrs={
-                "type": "date",
-            }),
-            "summary": forms.Textarea(attrs={
-                "rows": 2,
-                "maxlength": 200,
-                "placeholder": "A brief summary (max 200 chars)...",
-            }),
-            "body": forms.Textarea(attrs={
-                "id": "editor-body",
-                "placeholder": "Start writing...",
-                "class": (
-                    "w-full min-h-[400px] px-6 py-4 font-mono text-[14px]"
-                    " leading-relaxed text-ink bg-transparent border-none"
-                    " outline-none resize-y placeholder:text-ink-muted"
-                ),
-            }),
-            "youtube_id": forms.TextInput(attrs={
-                "placeholder": "YouTube video ID",
-            }),
-            "thumbnail": forms.TextInput(attrs={
-                "placeholder": "/collage/thumbnail.png",
-            }),
-            "image": forms.TextInput(attrs={
-                "placeholder": "/collage/image.png",
-            }),
-            "callout": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Callout text. Use [link text](url) for hyperlinks.",
-            }),
-            "stage": forms.Select(),
-            "composition": CompositionWidget(),
-            # JSON fields with structured widgets
-            "tags": TagsWidget(),
-            "sources": StructuredListWidget(fields_schema=SOURCES_SCHEMA),
-            "related": SlugListWidget(attrs={
-                "placeholder": "essay-slug-1, essay-slug-2",
-            }),
-            "callouts": StructuredListWidget(fields_schema=CALLOUTS_SCHEMA),
-            "annotations": StructuredListWidget(fields_schema=ANNOTATIONS_SCHEMA),
-            # Process proof fields
-            "thesis": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "One-sentence thesis for this essay...",
-            }),
-            "research_started": forms.DateInput(attrs={
-                "type": "date",
-            }),
-            "source_summary": forms.TextInput(attrs={
-                "placeholder": "e.g. 4 articles, 2 books, 1 interview",
-            }),
-            "connected_types": TagsWidget(attrs={
-                "placeholder": "field-note, project, shelf-entry",
-            }),
-            "research_notes": forms.Textarea(attrs={
-                "rows": 4,
-                "placeholder": "Research notes, open questions, leads...",
-            }),
-            "connection_notes": forms.Textarea(attrs={
-                "rows": 3,
-                "placeholder": "How this essay connects to other content...",
-            }),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Identity",
-                "title", "slug", "date",
-                css_class="section-terracotta",
-            ),
-            Fieldset(
-                "Content",
-                "summary", "stage",
-                css_class="",
-            ),
-            Fieldset(
-                "Media",
-                "youtube_id", "thumbnail", "image",
-                css_class="",
-            ),
-            Fieldset(
-                "Taxonomy",
-                "tags", "related",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "Structured Data",
-                "sources", "annotations", "callouts", "callout",
-                css_class="section-gold with-grid",
-            ),
-            Fieldset(
-                "Process Proof",
-                "thesis", "source_count", "research_started",
-                "revision_count", "source_summary", "connected_types",
-                "research_notes", "connection_notes",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "Advanced",
-                "draft", "composition",
-                css_class="",
-            ),
+            "draft",
+            "composition",
+            "body",
         )
+        widgets = _ESSAY_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Identity",
+            *_IDENTITY_FIELDS,
+            css_class="section-terracotta",
+        ),
+        Fieldset(
+            "Content",
+            "summary", "stage",
+            css_class="",
+        ),
+        Fieldset(
+            "Media",
+            "youtube_id", "thumbnail", "image",
+            css_class="",
+        ),
+        Fieldset(
+            "Taxonomy",
+            "tags", "related",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "Structured Data",
+            "sources", "annotations", "callouts", "callout",
+            css_class="section-gold with-grid",
+        ),
+        Fieldset(
+            "Process Proof",
+            "thesis", "source_count", "research_started", "revision_count",
+            "source_summary", "connected_types", "research_notes",
+            "connection_notes",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "Advanced",
+            "draft", "composition",
+            css_class="start-collapsed",
+        ),
+    )
+
+
+_FIELD_NOTE_WIDGETS = {
+    "title": forms.TextInput(attrs={
+        "placeholder": "Note title...",
+        "autocomplete": "off",
+    }),
+    "slug": _SLUG_WIDGET,
+    "date": _DATE_WIDGET,
+    "body": _EDITOR_BODY_WIDGET,
+    "excerpt": forms.Textarea(attrs={
+        "rows": 2,
+        "maxlength": 300,
+        "placeholder": "Brief excerpt (max 300 chars)...",
+    }),
+    "status": forms.Select(),
+    "connected_to": forms.TextInput(attrs={"placeholder": "Parent essay slug"}),
+    "callout": _CALLOUT_WIDGET,
+    "composition": JsonObjectListWidget(
+        attrs={"rows": 3},
+        placeholder_hint=FIELD_NOTE_COMPOSITION_HINT,
+    ),
+    # JSON fields with structured widgets
+    "tags": _TAGS_WIDGET,
+    "callouts": _CALLOUTS_WIDGET,
+}
 
 
 class FieldNoteForm(forms.ModelForm):
     class Meta:
         model = FieldNote
-        fields = [
-            "title",
-            "slug",
-            "date",
-            "body",
-            "tags",
+        fields = _IDENTITY_FIELDS + (
             "excerpt",
-            "draft",
-            "callout",
-            "callouts",
             "status",
-            "featured",
+            "tags",
             "connected_to",
+            "callouts",
+            "callout",
+            "draft",
+            "featured",
             "composition",
-        ]
-        widgets = {
-            "title": forms.TextInput(attrs={
-                "placeholder": "Note title...",
-                "autocomplete": "off",
-            }),
-            "slug": forms.TextInput(attrs={
-                "placeholder": "auto-generated-from-title",
-            }),
-            "date": forms.DateInput(attrs={"type": "date"}),
-            "body": forms.Textarea(attrs={
-                "id": "editor-body",
-                "placeholder": "Start writing...",
-                "class": (
-                    "w-full min-h-[400px] px-6 py-4 font-mono text-[14px]"
-                    " leading-relaxed text-ink bg-transparent border-none"
-                    " outline-none resize-y placeholder:text-ink-muted"
-                ),
-            }),
-            "excerpt": forms.Textarea(attrs={
-                "rows": 2,
-                "maxlength": 300,
-                "placeholder": "Brief excerpt (max 300 chars)...",
-            }),
-            "status": forms.Select(),
-            "connected_to": forms.TextInput(attrs={
-                "placeholder": "Parent essay slug",
-            }),
-            "callout": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Callout text. Use [link text](url) for hyperlinks.",
-            }),
-            "composition": JsonObjectListWidget(
-                attrs={"rows": 3},
-                placeholder_hint='{\n  "layout": "compact"\n}',
-            ),
-            # JSON fields with structured widgets
-            "tags": TagsWidget(),
-            "callouts": StructuredListWidget(fields_schema=CALLOUTS_SCHEMA),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Identity",
-                "title", "slug", "date",
-                css_class="section-terracotta",
-            ),
-            Fieldset(
-                "Content",
-                "excerpt", "status",
-                css_class="",
-            ),
-            Fieldset(
-                "Taxonomy",
-                "tags", "connected_to",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "Structured Data",
-                "callouts", "callout",
-                css_class="section-gold with-grid",
-            ),
-            Fieldset(
-                "Advanced",
-                "draft", "featured", "composition",
-                css_class="",
-            ),
+            "body",
         )
+        widgets = _FIELD_NOTE_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Identity",
+            *_IDENTITY_FIELDS,
+            css_class="section-terracotta",
+        ),
+        Fieldset(
+            "Content",
+            "excerpt", "status",
+            css_class="",
+        ),
+        Fieldset(
+            "Taxonomy",
+            "tags", "connected_to",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "Structured Data",
+            "callouts", "callout",
+            css_class="section-gold with-grid",
+        ),
+        Fieldset(
+            "Advanced",
+            "draft", "featured", "composition",
+            css_class="start-collapsed",
+        ),
+    )
+
+
+_SHELF_ENTRY_WIDGETS = {
+    "title": forms.TextInput(attrs={
+        "placeholder": "Title...",
+        "autocomplete": "off",
+    }),
+    "slug": _SLUG_WIDGET,
+    "creator": forms.TextInput(attrs={"placeholder": "Author / creator"}),
+    "type": forms.Select(),
+    "annotation": EditorBodyTextarea(
+        attrs={"rows": 6},
+        placeholder="Your annotation...",
+        min_height="200px",
+    ),
+    "url": forms.URLInput(attrs={"placeholder": "https://..."}),
+    "date": _DATE_WIDGET,
+    "connected_essay": forms.TextInput(attrs={"placeholder": "Related essay slug"}),
+    "stage": forms.Select(),
+    "composition": JsonObjectListWidget(
+        attrs={"rows": 3},
+        placeholder_hint=EMPTY_COMPOSITION_HINT,
+    ),
+    # JSON fields with custom widgets
+    "tags": _TAGS_WIDGET,
+}
 
 
 class ShelfEntryForm(forms.ModelForm):
     class Meta:
         model = ShelfEntry
-        fields = [
-            "title",
-            "slug",
+        fields = _IDENTITY_FIELDS + (
             "creator",
             "type",
-            "annotation",
             "url",
-            "date",
+            "stage",
             "tags",
             "connected_essay",
-            "stage",
             "composition",
-        ]
-        widgets = {
-            "title": forms.TextInput(attrs={
-                "placeholder": "Title...",
-                "autocomplete": "off",
-            }),
-            "slug": forms.TextInput(attrs={
-                "placeholder": "auto-generated-from-title",
-            }),
-            "creator": forms.TextInput(attrs={
-                "placeholder": "Author / creator",
-            }),
-            "type": forms.Select(),
-            "annotation": forms.Textarea(attrs={
-                "id": "editor-body",
-                "rows": 6,
-                "placeholder": "Your annotation...",
-                "class": (
-                    "w-full min-h-[200px] px-6 py-4 font-mono text-[14px]"
-                    " leading-relaxed text-ink bg-transparent border-none"
-                    " outline-none resize-y placeholder:text-ink-muted"
-                ),
-            }),
-            "url": forms.URLInput(attrs={
-                "placeholder": "https://...",
-            }),
-            "date": forms.DateInput(attrs={"type": "date"}),
-            "connected_essay": forms.TextInput(attrs={
-                "placeholder": "Related essay slug",
-            }),
-            "stage": forms.Select(),
-            "composition": JsonObjectListWidget(
-                attrs={"rows": 3},
-                placeholder_hint='{}',
-            ),
-            # JSON fields with custom widgets
-            "tags": TagsWidget(),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Identity",
-                "title", "slug", "date",
-                css_class="section-terracotta",
-            ),
-            Fieldset(
-                "Details",
-                "creator", "type", "url",
-                css_class="",
-            ),
-            Fieldset(
-                "Content",
-                "stage",
-                css_class="",
-            ),
-            Fieldset(
-                "Taxonomy",
-                "tags", "connected_essay",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "Advanced",
-                "composition",
-                css_class="",
-            ),
+            "annotation",
         )
+        widgets = _SHELF_ENTRY_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Identity",
+            *_IDENTITY_FIELDS,
+            css_class="section-terracotta",
+        ),
+        Fieldset(
+            "Details",
+            "creator", "type", "url",
+            css_class="",
+        ),
+        Fieldset(
+            "Content",
+            "stage",
+            css_class="",
+        ),
+        Fieldset(
+            "Taxonomy",
+            "tags", "connected_essay",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "Advanced",
+            "composition",
+            css_class="start-collapsed",
+        ),
+    )
+
+
+_PROJECT_WIDGETS = {
+    "title": forms.TextInput(attrs={
+        "placeholder": "Project title...",
+        "autocomplete": "off",
+    }),
+    "slug": _SLUG_WIDGET,
+    "role": forms.TextInput(attrs={
+        "placeholder": "Your role (e.g. Built & Designed)",
+    }),
+    "description": forms.Textarea(attrs={
+        "rows": 2,
+        "maxlength": 300,
+        "placeholder": "Brief description (max 300 chars)...",
+    }),
+    "year": forms.NumberInput(),
+    "date": _DATE_WIDGET,
+    "organization": forms.TextInput(attrs={"placeholder": "Organization name"}),
+    "body": EditorBodyTextarea(placeholder="Project details..."),
+    "callout": _CALLOUT_WIDGET,
+    "order": forms.NumberInput(attrs={"placeholder": "Sort order (0 = default)"}),
+    "stage": forms.Select(),
+    "composition": JsonObjectListWidget(
+        attrs={"rows": 3},
+        placeholder_hint=PROJECT_COMPOSITION_HINT,
+    ),
+    # JSON fields with structured widgets
+    "tags": _TAGS_WIDGET,
+    "urls": UrlsWidget(),
+}
 
 
 class ProjectForm(forms.ModelForm):
     class Meta:
         model = Project
-        fields = [
-            "title",
-            "slug",
-            "role",
-            "description",
+        fields = _IDENTITY_FIELDS + (
             "year",
-            "date",
+            "role",
             "organization",
-            "urls",
-            "tags",
-            "featured",
-            "draft",
+            "description",
             "order",
             "callout",
-            "body",
             "stage",
+            "tags",
+            "urls",
+            "draft",
+            "featured",
             "composition",
-        ]
-        widgets = {
-            "title": forms.TextInput(attrs={
-                "placeholder": "Project title...",
-                "autocomplete": "off",
-            }),
-            "slug": forms.TextInput(attrs={
-                "placeholder": "auto-generated-from-title",
-            }),
-            "role": forms.TextInput(attrs={
-                "placeholder": "Your role (e.g. Built & Designed)",
-            }),
-            "description": forms.Textarea(attrs={
-                "rows": 2,
-                "maxlength": 300,
-                "placeholder": "Brief description (max 300 chars)...",
-            }),
-            "year": forms.NumberInput(),
-            "date": forms.DateInput(attrs={"type": "date"}),
-            "organization": forms.TextInput(attrs={
-                "placeholder": "Organization name",
-            }),
-            "body": forms.Textarea(attrs={
-                "id": "editor-body",
-                "placeholder": "Project details...",
-                "class": (
-                    "w-full min-h-[400px] px-6 py-4 font-mono text-[14px]"
-                    " leading-relaxed text-ink bg-transparent border-none"
-                    " outline-none resize-y placeholder:text-ink-muted"
-                ),
-            }),
-            "callout": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Callout text. Use [link text](url) for hyperlinks.",
-            }),
-            "order": forms.NumberInput(attrs={
-                "placeholder": "Sort order (0 = default)",
-            }),
-            "stage": forms.Select(),
-            "composition": JsonObjectListWidget(
-                attrs={"rows": 3},
-                placeholder_hint='{\n  "tint": "teal"\n}',
-            ),
-            # JSON fields with structured widgets
-            "tags": TagsWidget(),
-            "urls": StructuredListWidget(fields_schema=URLS_SCHEMA),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Identity",
-                "title", "slug", "date", "year",
-                css_class="section-terracotta",
-            ),
-            Fieldset(
-                "Details",
-                "role", "organization", "description", "order",
-                css_class="",
-            ),
-            Fieldset(
-                "Content",
-                "callout", "stage",
-                css_class="",
-            ),
-            Fieldset(
-                "Taxonomy",
-                "tags",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "Structured Data",
-                "urls",
-                css_class="section-gold with-grid",
-            ),
-            Fieldset(
-                "Advanced",
-                "draft", "featured", "composition",
-                css_class="",
-            ),
+            "body",
         )
+        widgets = _PROJECT_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Identity",
+            *_IDENTITY_FIELDS, "year",
+            css_class="section-terracotta",
+        ),
+        Fieldset(
+            "Details",
+            "role", "organization", "description", "order",
+            css_class="",
+        ),
+        Fieldset(
+            "Content",
+            "callout", "stage",
+            css_class="",
+        ),
+        Fieldset(
+            "Taxonomy",
+            "tags",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "Structured Data",
+            "urls",
+            css_class="section-gold with-grid",
+        ),
+        Fieldset(
+            "Advanced",
+            "draft", "featured", "composition",
+            css_class="start-collapsed",
+        ),
+    )
+
+
+_TOOLKIT_ENTRY_WIDGETS = {
+    "title": forms.TextInput(attrs={
+        "placeholder": "Tool or process name...",
+        "autocomplete": "off",
+    }),
+    "slug": _SLUG_WIDGET,
+    "category": forms.TextInput(attrs={
+        "placeholder": "e.g. production, research, automation",
+    }),
+    "order": forms.NumberInput(attrs={"placeholder": "Sort order (0 = default)"}),
+    "body": EditorBodyTextarea(placeholder="Describe this tool or process..."),
+    "stage": forms.Select(),
+    "composition": JsonObjectListWidget(
+        attrs={"rows": 3},
+        placeholder_hint=EMPTY_COMPOSITION_HINT,
+    ),
+}
 
 
 class ToolkitEntryForm(forms.ModelForm):
     class Meta:
         model = ToolkitEntry
-        fields = [
+        fields = (
             "title",
             "slug",
             "category",
             "order",
-            "body",
             "stage",
             "composition",
-        ]
-        widgets = {
-            "title": forms.TextInput(attrs={
-                "placeholder": "Tool or process name...",
-                "autocomplete": "off",
-            }),
-            "slug": forms.TextInput(attrs={
-                "placeholder": "auto-generated-from-title",
-            }),
-            "category": forms.TextInput(attrs={
-                "placeholder": "e.g. production, research, automation",
-            }),
-            "order": forms.NumberInput(attrs={
-                "placeholder": "Sort order (0 = default)",
-            }),
-            "body": forms.Textarea(attrs={
-                "id": "editor-body",
-                "placeholder": "Describe this tool or process...",
-                "class": (
-                    "w-full min-h-[400px] px-6 py-4 font-mono text-[14px]"
-                    " leading-relaxed text-ink bg-transparent border-none"
-                    " outline-none resize-y placeholder:text-ink-muted"
-                ),
-            }),
-            "stage": forms.Select(),
-            "composition": JsonObjectListWidget(
-                attrs={"rows": 3},
-                placeholder_hint='{}',
-            ),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Identity",
-                "title", "slug",
-                css_class="section-terracotta",
-            ),
-            Fieldset(
-                "Details",
-                "category", "order",
-                css_class="",
-            ),
-            Fieldset(
-                "Content",
-                "stage",
-                css_class="",
-            ),
-            Fieldset(
-                "Advanced",
-                "composition",
-                css_class="",
-            ),
+            "body",
         )
+        widgets = _TOOLKIT_ENTRY_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Identity",
+            "title", "slug",
+            css_class="section-terracotta",
+        ),
+        Fieldset(
+            "Details",
+            "category", "order",
+            css_class="",
+        ),
+        Fieldset(
+            "Content",
+            "stage",
+            css_class="",
+        ),
+        Fieldset(
+            "Advanced",
+            "composition",
+            css_class="start-collapsed",
+        ),
+    )
+
+
+_NOW_PAGE_WIDGETS = {
+    "updated": _DATE_WIDGET,
+    "researching": forms.TextInput(attrs={
+        "placeholder": "Currently researching...",
+    }),
+    "researching_context": _CONTEXT_WIDGET,
+    "reading": forms.TextInput(attrs={"placeholder": "Currently reading..."}),
+    "reading_context": _CONTEXT_WIDGET,
+    "building": forms.TextInput(attrs={"placeholder": "Currently building..."}),
+    "building_context": _CONTEXT_WIDGET,
+    "listening": forms.TextInput(attrs={"placeholder": "Currently listening to..."}),
+    "listening_context": _CONTEXT_WIDGET,
+    "thinking": forms.Textarea(attrs={
+        "rows": 4,
+        "placeholder": "What you're thinking about...",
+    }),
+}
 
 
 class NowPageForm(forms.ModelForm):
     class Meta:
         model = NowPage
-        fields = [
+        fields = (
             "updated",
             "researching",
             "researching_context",
@@ -549,67 +520,28 @@ class NowPageForm(forms.ModelForm):
             "listening",
             "listening_context",
             "thinking",
-        ]
-        widgets = {
-            "updated": forms.DateInput(attrs={"type": "date"}),
-            "researching": forms.TextInput(attrs={
-                "placeholder": "Currently researching...",
-            }),
-            "researching_context": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Context...",
-            }),
-            "reading": forms.TextInput(attrs={
-                "placeholder": "Currently reading...",
-            }),
-            "reading_context": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Context...",
-            }),
-            "building": forms.TextInput(attrs={
-                "placeholder": "Currently building...",
-            }),
-            "building_context": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Context...",
-            }),
-            "listening": forms.TextInput(attrs={
-                "placeholder": "Currently listening to...",
-            }),
-            "listening_context": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Context...",
-            }),
-            "thinking": forms.Textarea(attrs={
-                "rows": 4,
-                "placeholder": "What you're thinking about...",
-            }),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Status",
-                "updated",
-                css_class="section-terracotta",
-            ),
-            Fieldset(
-                "Activities",
-                "researching", "researching_context",
-                "reading", "reading_context",
-                "building", "building_context",
-                "listening", "listening_context",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "Reflection",
-                "thinking",
-                css_class="section-gold",
-            ),
         )
+        widgets = _NOW_PAGE_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Status",
+            "updated",
+            css_class="section-terracotta",
+        ),
+        Fieldset(
+            "Activities",
+            "researching", "researching_context", "reading", "reading_context",
+            "building", "building_context", "listening", "listening_context",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "Reflection",
+            "thinking",
+            css_class="section-gold",
+        ),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -617,191 +549,145 @@ class NowPageForm(forms.ModelForm):
 # ---------------------------------------------------------------------------
 
 
+_DESIGN_TOKEN_SET_WIDGETS = {
+    "colors": JsonObjectListWidget(
+        attrs={"rows": 8},
+        placeholder_hint=DESIGN_COLORS_HINT,
+    ),
+    "fonts": JsonObjectListWidget(
+        attrs={"rows": 6},
+        placeholder_hint=DESIGN_FONTS_HINT,
+    ),
+    "spacing": JsonObjectListWidget(
+        attrs={"rows": 4},
+        placeholder_hint=DESIGN_SPACING_HINT,
+    ),
+    "section_colors": JsonObjectListWidget(
+        attrs={"rows": 6},
+        placeholder_hint=DESIGN_SECTION_COLORS_HINT,
+    ),
+}
+
+
 class DesignTokenSetForm(forms.ModelForm):
     class Meta:
         model = DesignTokenSet
-        fields = ["colors", "fonts", "spacing", "section_colors"]
-        widgets = {
-            "colors": JsonObjectListWidget(
-                attrs={"rows": 8},
-                placeholder_hint=(
-                    '{\n'
-                    '  "terracotta": "#B45A2D",\n'
-                    '  "teal": "#2D5F6B",\n'
-                    '  "gold": "#C49A4A",\n'
-                    '  "green": "#5A7A4A",\n'
-                    '  "parchment": "#F5F0E8",\n'
-                    '  "darkGround": "#2A2824",\n'
-                    '  "cream": "#F0EBE3"\n'
-                    '}'
-                ),
-            ),
-            "fonts": JsonObjectListWidget(
-                attrs={"rows": 6},
-                placeholder_hint=(
-                    '{\n'
-                    '  "title": "Vollkorn",\n'
-                    '  "body": "Cabin",\n'
-                    '  "mono": "Courier Prime",\n'
-                    '  "annotation": "Caveat",\n'
-                    '  "tagline": "Ysabeau"\n'
-                    '}'
-                ),
-            ),
-            "spacing": JsonObjectListWidget(
-                attrs={"rows": 4},
-                placeholder_hint=(
-                    '{\n'
-                    '  "contentMaxWidth": "896px",\n'
-                    '  "heroMaxWidth": "1152px"\n'
-                    '}'
-                ),
-            ),
-            "section_colors": JsonObjectListWidget(
-                attrs={"rows": 6},
-                placeholder_hint=(
-                    '{\n'
-                    '  "essays": "terracotta",\n'
-                    '  "fieldNotes": "teal",\n'
-                    '  "projects": "gold"\n'
-                    '}'
-                ),
-            ),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Design Tokens",
-                "colors", "fonts", "spacing", "section_colors",
-                css_class="section-terracotta with-grid",
-            ),
-        )
+        fields = ("colors", "fonts", "spacing", "section_colors")
+        widgets = _DESIGN_TOKEN_SET_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Design Tokens",
+            "colors", "fonts", "spacing", "section_colors",
+            css_class="section-terracotta with-grid",
+        ),
+    )
+
+
+_NAV_ITEM_WIDGETS = {
+    "label": forms.TextInput(attrs={"placeholder": "Nav label"}),
+    "path": forms.TextInput(attrs={"placeholder": "/section-path"}),
+    "icon": forms.TextInput(attrs={
+        "placeholder": "SketchIcon name (e.g. file-text)",
+    }),
+    "order": forms.NumberInput(attrs={"placeholder": "0"}),
+}
 
 
 class NavItemForm(forms.ModelForm):
     class Meta:
         model = NavItem
-        fields = ["label", "path", "icon", "visible", "order"]
-        widgets = {
-            "label": forms.TextInput(attrs={
-                "placeholder": "Nav label",
-            }),
-            "path": forms.TextInput(attrs={
-                "placeholder": "/section-path",
-            }),
-            "icon": forms.TextInput(attrs={
-                "placeholder": "SketchIcon name (e.g. file-text)",
-            }),
-            "order": forms.NumberInput(attrs={
-                "placeholder": "0",
-            }),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            "label", "path", "icon", "visible", "order",
-        )
+        fields = ("label", "path", "icon", "visible", "order")
+        widgets = _NAV_ITEM_WIDGETS
 
 
+# No extra blank row: nav_editor.html clones formset.empty_form client-side
+# when "+ Add Nav Item" is clicked, so GET only builds forms for real rows.
 NavItemFormSet = forms.modelformset_factory(
     NavItem,
     form=NavItemForm,
-    extra=1,
+    extra=0,
     can_delete=True,
 )
 
 
+_PAGE_COMPOSITION_WIDGETS = {
+    "page_key": forms.Select(),
+    "settings": JsonObjectListWidget(
+        attrs={"rows": 12},
+        placeholder_hint=PAGE_SETTINGS_HINT,
+    ),
+}
+
+
 class PageCompositionForm(forms.ModelForm):
     class Meta:
         model = PageComposition
-        fields = ["page_key", "settings"]
-        widgets = {
-            "page_key": forms.Select(),
-            "settings": JsonObjectListWidget(
-                attrs={"rows": 12},
-                placeholder_hint='{\n  "key": "value"\n}',
-            ),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Page Composition",
-                "page_key", "settings",
-                css_class="section-gold with-grid",
-            ),
-        )
+        fields = ("page_key", "settings")
+        widgets = _PAGE_COMPOSITION_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Page Composition",
+            "page_key", "settings",
+            css_class="section-gold with-grid",
+        ),
+    )
+
+
+_SITE_SETTINGS_WIDGETS = {
+    "footer_tagline": forms.TextInput(attrs={"placeholder": "Footer tagline text"}),
+    "footer_links": FooterLinksWidget(),
+    "seo_title_template": forms.TextInput(attrs={
+        "placeholder": "%s | travisgilbert.me",
+    }),
+    "seo_description": forms.Textarea(attrs={
+        "rows": 3,
+        "placeholder": "Default meta description...",
+    }),
+    "seo_og_image_fallback": forms.TextInput(attrs={
+        "placeholder": "https://travisgilbert.me/og-image.png",
+    }),
+    "global_toggles": JsonObjectListWidget(
+        attrs={"rows": 5},
+        placeholder_hint=SITE_TOGGLES_HINT,
+    ),
+}
 
 
 class SiteSettingsForm(forms.ModelForm):
     class Meta:
         model = SiteSettings
-        fields = [
+        fields = (
             "footer_tagline",
             "footer_links",
             "seo_title_template",
             "seo_description",
             "seo_og_image_fallback",
             "global_toggles",
-        ]
-        widgets = {
-            "footer_tagline": forms.TextInput(attrs={
-                "placeholder": "Footer tagline text",
-            }),
-            "footer_links": StructuredListWidget(fields_schema=FOOTER_LINKS_SCHEMA),
-            "seo_title_template": forms.TextInput(attrs={
-                "placeholder": "%s | travisgilbert.me",
-            }),
-            "seo_description": forms.Textarea(attrs={
-                "rows": 3,
-                "placeholder": "Default meta description...",
-            }),
-            "seo_og_image_fallback": forms.TextInput(attrs={
-                "placeholder": "https://travisgilbert.me/og-image.png",
-            }),
-            "global_toggles": JsonObjectListWidget(
-                attrs={"rows": 5},
-                placeholder_hint=(
-                    '{\n'
-                    '  "dotgrid_enabled": true,\n'
-                    '  "paper_grain_enabled": true,\n'
-                    '  "console_easter_egg": true\n'
-                    '}'
-                ),
-            ),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Footer",
-                "footer_tagline", "footer_links",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "SEO",
-                "seo_title_template", "seo_description", "seo_og_image_fallback",
-                css_class="section-terracotta",
-            ),
-            Fieldset(
-                "Toggles",
-                "global_toggles",
-                css_class="section-gold",
-            ),
         )
+        widgets = _SITE_SETTINGS_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Footer",
+            "footer_tagline", "footer_links",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "SEO",
+            "seo_title_template", "seo_description", "seo_og_image_fallback",
+            css_class="section-terracotta",
+        ),
+        Fieldset(
+            "Toggles",
+            "global_toggles",
+            css_class="section-gold",
+        ),
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -809,17 +695,74 @@ class SiteSettingsForm(forms.ModelForm):
 # ---------------------------------------------------------------------------
 
 
+_VIDEO_PROJECT_WIDGETS = {
+    "title": forms.TextInput(attrs={
+        "placeholder": "Video title...",
+        "autocomplete": "off",
+    }),
+    "slug": _SLUG_WIDGET,
+    "short_title": forms.TextInput(attrs={
+        "placeholder": "Short title for dashboards...",
+    }),
+    "thesis": forms.Textarea(attrs={
+        "rows": 2,
+        "placeholder": "One-sentence thesis for this video...",
+    }),
+    "research_notes": forms.Textarea(attrs={
+        "rows": 6,
+        "placeholder": "Research notes (Markdown)...",
+    }),
+    "script_body": EditorBodyTextarea(
+        placeholder="Full script with [VO], [ON-CAMERA], [B-ROLL], [GRAPHIC] tags...",
+    ),
+    "youtube_title": forms.TextInput(attrs={
+        "placeholder": "YouTube title (max 100 chars)",
+        "maxlength": 100,
+    }),
+    "youtube_description": forms.Textarea(attrs={
+        "rows": 4,
+        "placeholder": "YouTube description...",
+    }),
+    "youtube_category": forms.TextInput(attrs={"placeholder": "Education"}),
+    "youtube_thumbnail_path": forms.TextInput(attrs={
+        "placeholder": "/videos/thumbnails/filename.png",
+    }),
+    "youtube_id": forms.TextInput(attrs={
+        "placeholder": "YouTube video ID after upload",
+    }),
+    "youtube_url": forms.URLInput(attrs={
+        "placeholder": "https://youtube.com/watch?v=...",
+    }),
+    "ticktick_task_id": forms.TextInput(attrs={"placeholder": "TickTick task ID"}),
+    "ulysses_sheet_id": forms.TextInput(attrs={
+        "placeholder": "Ulysses sheet identifier",
+    }),
+    "descript_project_id": forms.TextInput(attrs={
+        "placeholder": "Descript project ID",
+    }),
+    "resolve_project_name": forms.TextInput(attrs={
+        "placeholder": "DaVinci Resolve project name",
+    }),
+    # JSON fields with structured widgets
+    "sources": VideoSourcesWidget(),
+    "youtube_tags": _TAGS_WIDGET,
+    "youtube_chapters": YoutubeChaptersWidget(),
+    "composition": _COMPOSITION_WIDGET,
+}
+
+
 class VideoProjectForm(forms.ModelForm):
     class Meta:
         model = VideoProject
-        fields = [
+        fields = (
             "title",
             "slug",
             "short_title",
             "thesis",
             "sources",
             "research_notes",
-            "script_body",
+            "linked_essays",
+            "linked_field_notes",
             "youtube_title",
             "youtube_description",
             "youtube_tags",
@@ -832,121 +775,69 @@ class VideoProjectForm(forms.ModelForm):
             "ulysses_sheet_id",
             "descript_project_id",
             "resolve_project_name",
-            "linked_essays",
-            "linked_field_notes",
             "composition",
-        ]
-        widgets = {
-            "title": forms.TextInput(attrs={
-                "placeholder": "Video title...",
-                "autocomplete": "off",
-            }),
-            "slug": forms.TextInput(attrs={
-                "placeholder": "auto-generated-from-title",
-            }),
-            "short_title": forms.TextInput(attrs={
-                "placeholder": "Short title for dashboards...",
-            }),
-            "thesis": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "One-sentence thesis for this video...",
-            }),
-            "research_notes": forms.Textarea(attrs={
-                "rows": 6,
-                "placeholder": "Research notes (Markdown)...",
-            }),
-            "script_body": forms.Textarea(attrs={
-                "id": "editor-body",
-                "placeholder": "Full script with [VO], [ON-CAMERA], [B-ROLL], [GRAPHIC] tags...",
-                "class": (
-                    "w-full min-h-[400px] px-6 py-4 font-mono text-[14px]"
-                    " leading-relaxed text-ink bg-transparent border-none"
-                    " outline-none resize-y placeholder:text-ink-muted"
-                ),
-            }),
-            "youtube_title": forms.TextInput(attrs={
-                "placeholder": "YouTube title (max 100 chars)",
-                "maxlength": 100,
-            }),
-            "youtube_description": forms.Textarea(attrs={
-                "rows": 4,
-                "placeholder": "YouTube description...",
-            }),
-            "youtube_category": forms.TextInput(attrs={
-                "placeholder": "Education",
-            }),
-            "youtube_thumbnail_path": forms.TextInput(attrs={
-                "placeholder": "/videos/thumbnails/filename.png",
-            }),
-            "youtube_id": forms.TextInput(attrs={
-                "placeholder": "YouTube video ID after upload",
-            }),
-            "youtube_url": forms.URLInput(attrs={
-                "placeholder": "https://youtube.com/watch?v=...",
-            }),
-            "ticktick_task_id": forms.TextInput(attrs={
-                "placeholder": "TickTick task ID",
-            }),
-            "ulysses_sheet_id": forms.TextInput(attrs={
-                "placeholder": "Ulysses sheet identifier",
-            }),
-            "descript_project_id": forms.TextInput(attrs={
-                "placeholder": "Descript project ID",
-            }),
-            "resolve_project_name": forms.TextInput(attrs={
-                "placeholder": "DaVinci Resolve project name",
-            }),
-            # JSON fields with structured widgets
-            "sources": StructuredListWidget(fields_schema=VIDEO_SOURCES_SCHEMA),
-            "youtube_tags": TagsWidget(),
-            "youtube_chapters": StructuredListWidget(fields_schema=YOUTUBE_CHAPTERS_SCHEMA),
-            "composition": CompositionWidget(),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
-        self.helper.layout = Layout(
-            Fieldset(
-                "Identity",
-                "title", "slug", "short_title",
-                css_class="section-green",
-            ),
-            Fieldset(
-                "Research",
-                "thesis", "sources", "research_notes",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "Connections",
-                "linked_essays", "linked_field_notes",
-                css_class="section-teal",
-            ),
-            Fieldset(
-                "YouTube Metadata",
-                "youtube_title", "youtube_description",
-                "youtube_tags", "youtube_category",
-                "youtube_chapters", "youtube_thumbnail_path",
-                css_class="section-gold",
-            ),
-            Fieldset(
-                "Post-Publish",
-                "youtube_id", "youtube_url",
-                css_class="",
-            ),
-            Fieldset(
-                "External Tools",
-                "ticktick_task_id", "ulysses_sheet_id",
-                "descript_project_id", "resolve_project_name",
-                css_class="",
-            ),
-            Fieldset(
-                "Advanced",
-                "composition",
-                css_class="",
-            ),
+            "script_body",
         )
+        widgets = _VIDEO_PROJECT_WIDGETS
+
+    helper = EditorFormHelper()
+    helper.layout = Layout(
+        Fieldset(
+            "Identity",
+            "title", "slug", "short_title",
+            css_class="section-green",
+        ),
+        Fieldset(
+            "Research",
+            "thesis", "sources", "research_notes",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "Connections",
+            "linked_essays", "linked_field_notes",
+            css_class="section-teal",
+        ),
+        Fieldset(
+            "YouTube Metadata",
+            "youtube_title", "youtube_description", "youtube_tags",
+            "youtube_category", "youtube_chapters", "youtube_thumbnail_path",
+            css_class="section-gold",
+        ),
+        Fieldset(
+            "Post-Publish",
+            "youtube_id", "youtube_url",
+            css_class="start-collapsed",
+        ),
+        Fieldset(
+            "External Tools",
+            "ticktick_task_id", "ulysses_sheet_id", "descript_project_id",
+            "resolve_project_name",
+            css_class="start-collapsed",
+        ),
+        Fieldset(
+            "Advanced",
+            "composition",
+            css_class="start-collapsed",
+        ),
+    )
+
+
+_VIDEO_SCENE_WIDGETS = {
+    "title": forms.TextInput(attrs={"placeholder": "Scene title..."}),
+    "script_text": forms.Textarea(attrs={
+        "rows": 6,
+        "placeholder": "Scene script text...",
+        "class": "w-full px-4 py-3 font-mono text-[13px] " + BARE_TEXTAREA_CLS,
+    }),
+    "notes": forms.Textarea(attrs={
+        "rows": 2,
+        "placeholder": "Production notes...",
+    }),
+    "order": forms.NumberInput(attrs={
+        "min": 0,
+        "class": "w-20",
+    }),
+}
 
 
 class VideoSceneForm(forms.ModelForm):
@@ -954,7 +845,7 @@ class VideoSceneForm(forms.ModelForm):
 
     class Meta:
         model = VideoScene
-        fields = [
+        fields = (
             "order",
             "title",
             "scene_type",
@@ -965,35 +856,18 @@ class VideoSceneForm(forms.ModelForm):
             "filmed",
             "assembled",
             "polished",
-        ]
-        widgets = {
-            "title": forms.TextInput(attrs={
-                "placeholder": "Scene title...",
-            }),
-            "script_text": forms.Textarea(attrs={
-                "rows": 6,
-                "placeholder": "Scene script text...",
-                "class": (
-                    "w-full px-4 py-3 font-mono text-[13px]"
-                    " leading-relaxed text-ink bg-transparent"
-                    " border-none outline-none resize-y"
-                    " placeholder:text-ink-muted"
-                ),
-            }),
-            "notes": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Production notes...",
-            }),
-            "order": forms.NumberInput(attrs={
-                "min": 0,
-                "class": "w-20",
-            }),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
-        self.helper.form_tag = False
+        )
+        widgets = _VIDEO_SCENE_WIDGETS
+
+
+_VIDEO_DELIVERABLE_WIDGETS = {
+    "file_path": forms.TextInput(attrs={"placeholder": "/videos/deliverables/..."}),
+    "file_url": forms.URLInput(attrs={"placeholder": "https://..."}),
+    "notes": forms.Textarea(attrs={
+        "rows": 2,
+        "placeholder": "Notes about this deliverable...",
+    }),
+}
 
 
 class VideoDeliverableForm(forms.ModelForm):
@@ -1001,27 +875,13 @@ class VideoDeliverableForm(forms.ModelForm):
 
     class Meta:
         model = VideoDeliverable
-        fields = [
+        fields = (
             "phase",
             "deliverable_type",
             "file_path",
             "file_url",
             "notes",
             "approved",
-        ]
-        widgets = {
-            "file_path": forms.TextInput(attrs={
-                "placeholder": "/videos/deliverables/...",
-            }),
-            "file_url": forms.URLInput(attrs={
-                "placeholder": "https://...",
-            }),
-            "notes": forms.Textarea(attrs={
-                "rows": 2,
-                "placeholder": "Notes about this deliverable...",
-            }),
-        }
-
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.helper = FormHelper()
+        )
+        widgets = _VIDEO_DELIVERABLE_WIDGETS
+
@@ -0,0 +1,22 @@
+import re
+
+from django.template import Context, Template
+from django.test import TestCase
+
+from apps.editor.forms import EssayForm
+
+
+class CollapsedSectionTest(TestCase):
+    template = Template("{% load crispy_forms_tags %}{% crispy form %}")
+
+    def section_states(self, form):
+        html = self.template.render(Context({"form": form}))
+        return re.findall(r"open: (true|false)", html)
+
+    def test_advanced_starts_collapsed(self):
+        self.assertEqual(self.section_states(EssayForm())[-1], "false")
+
+    def test_sections_open_when_form_has_errors(self):
+        form = EssayForm(data={})
+        self.assertFalse(form.is_valid())
+        self.assertNotIn("false", self.section_states(form))
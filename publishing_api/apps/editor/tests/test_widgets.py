@@ -0,0 +1,96 @@
+import copy
+import json
+
+from django.test import TestCase
+
+from apps.editor.forms import DesignTokenSetForm, EssayForm
+from apps.editor.widgets import (
+    SOURCES_SCHEMA,
+    CalloutsWidget,
+    CollageFragmentsWidget,
+    JsonObjectListWidget,
+    SourcesWidget,
+    StructuredListWidget,
+)
+
+
+class WidgetDeepcopyTest(TestCase):
+    def test_structured_list_copy_shares_schema(self):
+        widget = SourcesWidget(attrs={"class": "rows"})
+        clone = copy.deepcopy(widget)
+        self.assertIs(clone.fields_schema, SOURCES_SCHEMA)
+        self.assertNotIn("fields_schema", vars(clone))
+        self.assertIsNot(clone.attrs, widget.attrs)
+
+    def test_structured_list_copy_keeps_constructor_schema(self):
+        widget = StructuredListWidget(fields_schema=SOURCES_SCHEMA)
+        clone = copy.deepcopy(widget)
+        self.assertIs(clone.fields_schema, SOURCES_SCHEMA)
+
+    def test_json_widget_copy_has_independent_attrs(self):
+        widget = JsonObjectListWidget(attrs={"rows": 3}, placeholder_hint="{}")
+        clone = copy.deepcopy(widget)
+        clone.attrs["rows"] = 9
+        self.assertEqual(widget.attrs["rows"], 3)
+        self.assertEqual(clone.attrs["placeholder"], "{}")
+
+    def test_form_instances_share_schema(self):
+        first, second = EssayForm(), EssayForm()
+        first_widget = first.fields["sources"].widget
+        second_widget = second.fields["sources"].widget
+        self.assertIsNot(first_widget, second_widget)
+        self.assertIs(first_widget.fields_schema, second_widget.fields_schema)
+
+    def test_schema_is_read_only(self):
+        with self.assertRaises(TypeError):
+            SOURCES_SCHEMA[0]["name"] = "changed"
+
+
+class JsonObjectListWidgetTest(TestCase):
+    def test_blank_textarea_becomes_empty_list(self):
+        widget = JsonObjectListWidget()
+        self.assertEqual(widget.value_from_datadict({"colors": "  "}, {}, "colors"), "[]")
+
+    def test_invalid_json_is_reported_by_the_form(self):
+        form = DesignTokenSetForm(data={"colors": '{"teal": '})
+        self.assertFalse(form.is_valid())
+        self.assertIn("colors", form.errors)
+
+    def test_valid_json_is_parsed_once_by_the_form(self):
+        form = DesignTokenSetForm(data={"colors": '{"teal": "#2D5F6B"}'})
+        self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["colors"], {"teal": "#2D5F6B"})
+
+
+class StructuredListWidgetTest(TestCase):
+    def test_rows_are_collected_with_number_coercion(self):
+        widget = CollageFragmentsWidget()
+        data = {
+            "frags__0__src": "/collage/a.png",
+            "frags__0__width": "280",
+            "frags__0__rotate": "-2.5",
+            "frags__0__left": "48%",
+            "frags__1__src": "",
+        }
+        items = json.loads(widget.value_from_datadict(data, {}, "frags"))
+        self.assertEqual(len(items), 1)
+        self.assertEqual(items[0]["width"], 280)
+        self.assertEqual(items[0]["rotate"], -2.5)
+        self.assertEqual(items[0]["left"], "48%")
+        self.assertEqual(items[0]["height"], "")
+
+    def test_constructor_schema_gets_its_own_plan(self):
+        widget = StructuredListWidget(fields_schema=SOURCES_SCHEMA)
+        data = {"s__0__title": "A", "s__0__url": "https://example.com"}
+        items = json.loads(widget.value_from_datadict(data, {}, "s"))
+        self.assertEqual(items[0]["title"], "A")
+
+    def test_render_escapes_values_and_selects_option(self):
+        html = CalloutsWidget().render(
+            "callouts", [{"text": '<b>"quoted"</b>', "side": "left"}],
+        )
+        self.assertIn('name="callouts__0__text"', html)
+        self.assertIn("&lt;b&gt;&quot;quoted&quot;&lt;/b&gt;", html)
+        self.assertIn('<option value="left" selected>Left</option>', html)
+        self.assertIn('<option value="right">Right</option>', html)
+        self.assertIn('name="callouts____INDEX____side"', html)
@@ -1,9 +1,34 @@
-from django.urls import path
+from django.urls import include, path
 
 from apps.editor import views
 
 app_name = "editor"
 
+
+def _content_type_routes(
+    name, list_view, create_view, edit_view, publish_view, *slug_routes
+):
+    """
+    The list / new / edit / publish routes shared by every content type.
+
+    Names follow "<name>-list", "<name>-create", "<name>-edit" and
+    "<name>-publish"; slug_routes are extra per-item routes mounted
+    under the same <slug:slug>/ prefix.
+    """
+    return include([
+        path("", list_view.as_view(), name=f"{name}-list"),
+        path("new/", create_view.as_view(), name=f"{name}-create"),
+        path("<slug:slug>/", include([
+            path("", edit_view.as_view(), name=f"{name}-edit"),
+            path("publish/", publish_view.as_view(), name=f"{name}-publish"),
+            *slug_routes,
+        ])),
+    ])
+
+
+# Routes that share a leading path segment are grouped under include(), so
+# the resolver rejects a whole group with one prefix check instead of
+# trying each of its patterns.
 urlpatterns = [
     # Dashboard
     path("", views.DashboardView.as_view(), name="dashboard"),
@@ -17,98 +42,114 @@ urlpatterns = [
     # -----------------------------------------------------------------------
 
     # Essays
-    path("essays/", views.EssayListView.as_view(), name="essay-list"),
-    path("essays/new/", views.EssayCreateView.as_view(), name="essay-create"),
-    path("essays/<slug:slug>/", views.EssayEditView.as_view(), name="essay-edit"),
-    path("essays/<slug:slug>/publish/", views.EssayPublishView.as_view(), name="essay-publish"),
+    path("essays/", _content_type_routes(
+        "essay",
+        views.EssayListView,
+        views.EssayCreateView,
+        views.EssayEditView,
+        views.EssayPublishView,
+    )),
 
     # Field Notes
-    path("field-notes/", views.FieldNoteListView.as_view(), name="field-note-list"),
-    path("field-notes/new/", views.FieldNoteCreateView.as_view(), name="field-note-create"),
-    path("field-notes/<slug:slug>/", views.FieldNoteEditView.as_view(), name="field-note-edit"),
-    path("field-notes/<slug:slug>/publish/", views.FieldNotePublishView.as_view(), name="field-note-publish"),
+    path("field-notes/", _content_type_routes(
+        "field-note",
+        views.FieldNoteListView,
+        views.FieldNoteCreateView,
+        views.FieldNoteEditView,
+        views.FieldNotePublishView,
+    )),
 
     # Shelf
-    path("shelf/", views.ShelfListView.as_view(), name="shelf-list"),
-    path("shelf/new/", views.ShelfCreateView.as_view(), name="shelf-create"),
-    path("shelf/<slug:slug>/", views.ShelfEditView.as_view(), name="shelf-edit"),
-    path("shelf/<slug:slug>/publish/", views.ShelfPublishView.as_view(), name="shelf-publish"),
+    path("shelf/", _content_type_routes(
+        "shelf",
+        views.ShelfListView,
+        views.ShelfCreateView,
+        views.ShelfEditView,
+        views.ShelfPublishView,
+    )),
 
     # Projects
-    path("projects/", views.ProjectListView.as_view(), name="project-list"),
-    path("projects/new/", views.ProjectCreateView.as_view(), name="project-create"),
-    path("projects/<slug:slug>/", views.ProjectEditView.as_view(), name="project-edit"),
-    path("projects/<slug:slug>/publish/", views.ProjectPublishView.as_view(), name="project-publish"),
+    path("projects/", _content_type_routes(
+        "project",
+        views.ProjectListView,
+        views.ProjectCreateView,
+        views.ProjectEditView,
+        views.ProjectPublishView,
+    )),
 
     # Toolkit
-    path("toolkit/", views.ToolkitListView.as_view(), name="toolkit-list"),
-    path("toolkit/new/", views.ToolkitCreateView.as_view(), name="toolkit-create"),
-    path("toolkit/<slug:slug>/", views.ToolkitEditView.as_view(), name="toolkit-edit"),
-    path("toolkit/<slug:slug>/publish/", views.ToolkitPublishView.as_view(), name="toolkit-publish"),
+    path("toolkit/", _content_type_routes(
+        "toolkit",
+        views.ToolkitListView,
+        views.ToolkitCreateView,
+        views.ToolkitEditView,
+        views.ToolkitPublishView,
+    )),
 
     # Production Dashboard
     path("production/", views.ProductionDashboardView.as_view(), name="production-dashboard"),
 
     # Video Projects
-    path("video/", views.VideoListView.as_view(), name="video-list"),
-    path("video/new/", views.VideoCreateView.as_view(), name="video-create"),
-    path("video/<slug:slug>/", views.VideoEditView.as_view(), name="video-edit"),
-    path("video/<slug:slug>/publish/", views.VideoPublishView.as_view(), name="video-publish"),
-    path("video/<slug:slug>/set-phase/", views.VideoSetPhaseView.as_view(), name="video-set-phase"),
+    path("video/", _content_type_routes(
+        "video",
+        views.VideoListView,
+        views.VideoCreateView,
+        views.VideoEditView,
+        views.VideoPublishView,
+        path("set-phase/", views.VideoSetPhaseView.as_view(), name="video-set-phase"),
 
-    # Video HTMX inline endpoints (scenes, deliverables, sessions)
-    path("video/<slug:slug>/scenes/add/", views.VideoSceneAddView.as_view(), name="video-scene-add"),
-    path("video/<slug:slug>/scenes/<int:pk>/update/", views.VideoSceneUpdateView.as_view(), name="video-scene-update"),
-    path("video/<slug:slug>/scenes/<int:pk>/delete/", views.VideoSceneDeleteView.as_view(), name="video-scene-delete"),
-    path("video/<slug:slug>/scenes/<int:pk>/toggle/", views.VideoSceneToggleView.as_view(), name="video-scene-toggle"),
-    path("video/<slug:slug>/deliverables/add/", views.VideoDeliverableAddView.as_view(), name="video-deliverable-add"),
-    path("video/<slug:slug>/deliverables/<int:pk>/update/", views.VideoDeliverableUpdateView.as_view(), name="video-deliverable-update"),
-    path("video/<slug:slug>/deliverables/<int:pk>/delete/", views.VideoDeliverableDeleteView.as_view(), name="video-deliverable-delete"),
-    path("video/<slug:slug>/sessions/start/", views.VideoSessionStartView.as_view(), name="video-session-start"),
-    path("video/<slug:slug>/sessions/<int:pk>/stop/", views.VideoSessionStopView.as_view(), name="video-session-stop"),
+        # Video HTMX inline endpoints (scenes, deliverables, sessions)
+        path("scenes/add/", views.VideoSceneAddView.as_view(), name="video-scene-add"),
+        path("scenes/<int:pk>/update/", views.VideoSceneUpdateView.as_view(), name="video-scene-update"),
+        path("scenes/<int:pk>/delete/", views.VideoSceneDeleteView.as_view(), name="video-scene-delete"),
+        path("scenes/<int:pk>/toggle/", views.VideoSceneToggleView.as_view(), name="video-scene-toggle"),
+        path("deliverables/add/", views.VideoDeliverableAddView.as_view(), name="video-deliverable-add"),
+        path("deliverables/<int:pk>/update/", views.VideoDeliverableUpdateView.as_view(), name="video-deliverable-update"),
+        path("deliverables/<int:pk>/delete/", views.VideoDeliverableDeleteView.as_view(), name="video-deliverable-delete"),
+        path("sessions/start/", views.VideoSessionStartView.as_view(), name="video-session-start"),
+        path("sessions/<int:pk>/stop/", views.VideoSessionStopView.as_view(), name="video-session-stop"),
 
-    # Video research integration (HTMX, login-protected)
-    path("video/<slug:slug>/pull-research/", views.VideoPullResearchView.as_view(), name="video-pull-research"),
-    path("video/<slug:slug>/generate-description/", views.VideoGenerateDescriptionView.as_view(), name="video-generate-description"),
+        # Video research integration (HTMX, login-protected)
+        path("pull-research/", views.VideoPullResearchView.as_view(), name="video-pull-research"),
+        path("generate-description/", views.VideoGenerateDescriptionView.as_view(), name="video-generate-description"),
+    )),
 
     # -----------------------------------------------------------------------
     # Video API (JSON, for Orchestra Conductor + frontend)
     # -----------------------------------------------------------------------
-    path("api/videos/", views.VideoAPIListView.as_view(), name="api-video-list"),
-    path("api/videos/<slug:slug>/", views.VideoAPIDetailView.as_view(), name="api-video-detail"),
-    path("api/videos/<slug:slug>/sessions/", views.VideoAPISessionsView.as_view(), name="api-video-sessions"),
-    path("api/videos/<slug:slug>/log-session/", views.VideoAPILogSessionView.as_view(), name="api-video-log-session"),
-    path("api/videos/<slug:slug>/advance/", views.VideoAPIAdvanceView.as_view(), name="api-video-advance"),
-    path("api/videos/<slug:slug>/deliverable/", views.VideoAPIDeliverableView.as_view(), name="api-video-deliverable"),
-    path("api/videos/<slug:slug>/next-action/", views.VideoAPINextActionView.as_view(), name="api-video-next-action"),
+    path("api/videos/", include("apps.editor.api_urls")),
 
     # -----------------------------------------------------------------------
     # Research Panel API (JSON, proxies research_api + local notes)
     # -----------------------------------------------------------------------
-    path(
-        "api/research/<slug:content_type>/<slug:slug>/context/",
-        views.ResearchContextView.as_view(),
-        name="api-research-context",
-    ),
-    path(
-        "api/research/<slug:content_type>/<slug:slug>/graph/",
-        views.ResearchGraphView.as_view(),
-        name="api-research-graph",
-    ),
-    path(
-        "api/research/<slug:content_type>/<slug:slug>/notes/",
-        views.ResearchNoteListView.as_view(),
-        name="api-research-notes",
-    ),
-    path(
-        "api/research/<slug:content_type>/<slug:slug>/notes/<int:pk>/delete/",
-        views.ResearchNoteDeleteView.as_view(),
-        name="api-research-note-delete",
-    ),
+    path("api/research/", include([
+        path(
+            "<slug:content_type>/<slug:slug>/context/",
+            views.ResearchContextView.as_view(),
+            name="api-research-context",
+        ),
+        path(
+            "<slug:content_type>/<slug:slug>/graph/",
+            views.ResearchGraphView.as_view(),
+            name="api-research-graph",
+        ),
+        path(
+            "<slug:content_type>/<slug:slug>/notes/",
+            views.ResearchNoteListView.as_view(),
+            name="api-research-notes",
+        ),
+        path(
+            "<slug:content_type>/<slug:slug>/notes/<int:pk>/delete/",
+            views.ResearchNoteDeleteView.as_view(),
+            name="api-research-note-delete",
+        ),
+    ])),
 
     # Now page
-    path("now/", views.NowPageEditView.as_view(), name="now-edit"),
-    path("now/publish/", views.NowPagePublishView.as_view(), name="now-publish"),
+    path("now/", include([
+        path("", views.NowPageEditView.as_view(), name="now-edit"),
+        path("publish/", views.NowPagePublishView.as_view(), name="now-publish"),
+    ])),
 
     # -----------------------------------------------------------------------
     # Generic content actions
@@ -127,234 +168,242 @@ urlpatterns = [
     # -----------------------------------------------------------------------
     # Collage image upload
     # -----------------------------------------------------------------------
-    path(
-        "upload/collage/",
-        views.UploadCollageImageView.as_view(),
-        name="upload-collage",
-    ),
-    path(
-        "upload/remove-bg/",
-        views.RemoveBackgroundView.as_view(),
-        name="remove-bg",
-    ),
+    path("upload/", include([
+        path(
+            "collage/",
+            views.UploadCollageImageView.as_view(),
+            name="upload-collage",
+        ),
+        path(
+            "remove-bg/",
+            views.RemoveBackgroundView.as_view(),
+            name="remove-bg",
+        ),
+    ])),
 
     # -----------------------------------------------------------------------
     # Compose (page compositions)
     # -----------------------------------------------------------------------
-    path("compose/", views.PageCompositionListView.as_view(), name="compose-list"),
-    path("compose/new/", views.PageCompositionCreateView.as_view(), name="compose-create"),
-    path("compose/<slug:page_key>/", views.PageCompositionEditView.as_view(), name="compose-edit"),
+    path("compose/", include([
+        path("", views.PageCompositionListView.as_view(), name="compose-list"),
+        path("new/", views.PageCompositionCreateView.as_view(), name="compose-create"),
+        path("<slug:page_key>/", views.PageCompositionEditView.as_view(), name="compose-edit"),
+    ])),
 
     # -----------------------------------------------------------------------
     # Settings
     # -----------------------------------------------------------------------
-    path("settings/tokens/", views.DesignTokensEditView.as_view(), name="tokens-edit"),
-    path("settings/nav/", views.NavEditorView.as_view(), name="nav-editor"),
-    path("settings/site/", views.SiteSettingsEditView.as_view(), name="site-settings"),
-    path("settings/publish-log/", views.PublishLogListView.as_view(), name="publish-log"),
-    path("settings/publish-config/", views.PublishSiteConfigView.as_view(), name="publish-config"),
+    path("settings/", include([
+        path("tokens/", views.DesignTokensEditView.as_view(), name="tokens-edit"),
+        path("nav/", views.NavEditorView.as_view(), name="nav-editor"),
+        path("site/", views.SiteSettingsEditView.as_view(), name="site-settings"),
+        path("publish-log/", views.PublishLogListView.as_view(), name="publish-log"),
+        path("publish-config/", views.PublishSiteConfigView.as_view(), name="publish-config"),
+    ])),
 
     # -----------------------------------------------------------------------
     # Studio JSON wrappers (open API for Next.js Studio frontend)
     # -----------------------------------------------------------------------
-    path("editor/api/content/", views.StudioApiContentListView.as_view(), name="api-content-list"),
-    path(
-        "editor/api/content/<slug:content_type>/",
-        views.StudioApiContentTypeListView.as_view(),
-        name="api-content-type-list",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/create/",
-        views.StudioApiContentCreateView.as_view(),
-        name="api-content-create",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/",
-        views.StudioApiContentDetailView.as_view(),
-        name="api-content-detail",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/update/",
-        views.StudioApiContentUpdateView.as_view(),
-        name="api-content-update",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/delete/",
-        views.StudioApiContentDeleteView.as_view(),
-        name="api-content-delete",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/set-stage/",
-        views.StudioApiContentSetStageView.as_view(),
-        name="api-content-set-stage",
-    ),
-    path("editor/api/timeline/", views.StudioApiTimelineView.as_view(), name="api-timeline"),
-    path("editor/api/settings/", views.StudioApiSettingsView.as_view(), name="api-settings"),
-    path("editor/api/connections/", views.StudioApiConnectionsView.as_view(), name="api-connections"),
-    path(
-        "editor/api/commonplace/search/",
-        views.StudioApiCommonplaceSearchView.as_view(),
-        name="api-commonplace-search",
-    ),
-    # Stash
-    path(
-        "editor/api/content/<str:content_type>/<slug:slug>/stash/",
-        views.StudioApiStashListView.as_view(),
-        name="api-stash-list",
-    ),
-    path(
-        "editor/api/content/<str:content_type>/<slug:slug>/stash/<int:pk>/delete/",
-        views.StudioApiStashDeleteView.as_view(),
-        name="api-stash-delete",
-    ),
-    # Tasks
-    path(
-        "editor/api/content/<str:content_type>/<slug:slug>/tasks/",
-        views.StudioApiTaskListView.as_view(),
-        name="api-task-list",
-    ),
-    path(
-        "editor/api/content/<str:content_type>/<slug:slug>/tasks/<int:pk>/update/",
-        views.StudioApiTaskUpdateView.as_view(),
-        name="api-task-update",
-    ),
-    path(
-        "editor/api/content/<str:content_type>/<slug:slug>/tasks/<int:pk>/delete/",
-        views.StudioApiTaskDeleteView.as_view(),
-        name="api-task-delete",
-    ),
-    # All tasks (aggregate view)
-    path(
-        "editor/api/tasks/all/",
-        views.StudioApiAllTasksView.as_view(),
-        name="api-all-tasks",
-    ),
+    path("editor/api/", include([
+        path("content/", views.StudioApiContentListView.as_view(), name="api-content-list"),
+        path(
+            "content/<slug:content_type>/",
+            views.StudioApiContentTypeListView.as_view(),
+            name="api-content-type-list",
+        ),
+        path(
+            "content/<slug:content_type>/create/",
+            views.StudioApiContentCreateView.as_view(),
+            name="api-content-create",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/",
+            views.StudioApiContentDetailView.as_view(),
+            name="api-content-detail",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/update/",
+            views.StudioApiContentUpdateView.as_view(),
+            name="api-content-update",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/delete/",
+            views.StudioApiContentDeleteView.as_view(),
+            name="api-content-delete",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/set-stage/",
+            views.StudioApiContentSetStageView.as_view(),
+            name="api-content-set-stage",
+        ),
+        path("timeline/", views.StudioApiTimelineView.as_view(), name="api-timeline"),
+        path("settings/", views.StudioApiSettingsView.as_view(), name="api-settings"),
+        path("connections/", views.StudioApiConnectionsView.as_view(), name="api-connections"),
+        path(
+            "commonplace/search/",
+            views.StudioApiCommonplaceSearchView.as_view(),
+            name="api-commonplace-search",
+        ),
+        # Stash
+        path(
+            "content/<str:content_type>/<slug:slug>/stash/",
+            views.StudioApiStashListView.as_view(),
+            name="api-stash-list",
+        ),
+        path(
+            "content/<str:content_type>/<slug:slug>/stash/<int:pk>/delete/",
+            views.StudioApiStashDeleteView.as_view(),
+            name="api-stash-delete",
+        ),
+        # Tasks
+        path(
+            "content/<str:content_type>/<slug:slug>/tasks/",
+            views.StudioApiTaskListView.as_view(),
+            name="api-task-list",
+        ),
+        path(
+            "content/<str:content_type>/<slug:slug>/tasks/<int:pk>/update/",
+            views.StudioApiTaskUpdateView.as_view(),
+            name="api-task-update",
+        ),
+        path(
+            "content/<str:content_type>/<slug:slug>/tasks/<int:pk>/delete/",
+            views.StudioApiTaskDeleteView.as_view(),
+            name="api-task-delete",
+        ),
+        # All tasks (aggregate view)
+        path(
+            "tasks/all/",
+            views.StudioApiAllTasksView.as_view(),
+            name="api-all-tasks",
+        ),
 
-    # -----------------------------------------------------------------------
-    # Studio v4.1: Image Upload, Collage, Content Search
-    # -----------------------------------------------------------------------
-    path(
-        "editor/api/upload/image/",
-        views.EditorImageUploadView.as_view(),
-        name="api-upload-image",
-    ),
-    path(
-        "editor/api/collage/generate/",
-        views.CollageGenerateView.as_view(),
-        name="api-collage-generate",
-    ),
-    path(
-        "editor/api/collage/cutouts/",
-        views.CollageCutoutsListView.as_view(),
-        name="api-collage-cutouts",
-    ),
-    path(
-        "editor/api/search/",
-        views.ContentSearchView.as_view(),
-        name="api-content-search",
-    ),
-    # Mention backlinks
-    path(
-        "editor/api/mentions/<slug:content_type>/<slug:slug>/backlinks/",
-        views.EditorMentionBacklinksView.as_view(),
-        name="api-mention-backlinks",
-    ),
-    # Revisions
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/revisions/",
-        views.StudioApiRevisionListView.as_view(),
-        name="api-revision-list",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/revisions/<int:pk>/",
-        views.StudioApiRevisionDetailView.as_view(),
-        name="api-revision-detail",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/revisions/<int:pk>/diff/",
-        views.StudioApiRevisionDiffView.as_view(),
-        name="api-revision-diff",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/revisions/<int:pk>/restore/",
-        views.StudioApiRevisionRestoreView.as_view(),
-        name="api-revision-restore",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/publish/",
-        views.StudioApiContentPublishView.as_view(),
-        name="api-content-publish",
-    ),
+        # -------------------------------------------------------------------
+        # Studio v4.1: Image Upload, Collage, Content Search
+        # -------------------------------------------------------------------
+        path(
+            "upload/image/",
+            views.EditorImageUploadView.as_view(),
+            name="api-upload-image",
+        ),
+        path(
+            "collage/generate/",
+            views.CollageGenerateView.as_view(),
+            name="api-collage-generate",
+        ),
+        path(
+            "collage/cutouts/",
+            views.CollageCutoutsListView.as_view(),
+            name="api-collage-cutouts",
+        ),
+        path(
+            "search/",
+            views.ContentSearchView.as_view(),
+            name="api-content-search",
+        ),
+        # Mention backlinks
+        path(
+            "mentions/<slug:content_type>/<slug:slug>/backlinks/",
+            views.EditorMentionBacklinksView.as_view(),
+            name="api-mention-backlinks",
+        ),
+        # Revisions
+        path(
+            "content/<slug:content_type>/<slug:slug>/revisions/",
+            views.StudioApiRevisionListView.as_view(),
+            name="api-revision-list",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/revisions/<int:pk>/",
+            views.StudioApiRevisionDetailView.as_view(),
+            name="api-revision-detail",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/revisions/<int:pk>/diff/",
+            views.StudioApiRevisionDiffView.as_view(),
+            name="api-revision-diff",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/revisions/<int:pk>/restore/",
+            views.StudioApiRevisionRestoreView.as_view(),
+            name="api-revision-restore",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/publish/",
+            views.StudioApiContentPublishView.as_view(),
+            name="api-content-publish",
+        ),
 
-    # -----------------------------------------------------------------------
-    # Sheets (Batch 16: Ulysses-style sub-documents)
-    # -----------------------------------------------------------------------
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/sheets/",
-        views.StudioApiSheetListView.as_view(),
-        name="api-sheet-list",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/sheets/reorder/",
-        views.StudioApiSheetReorderView.as_view(),
-        name="api-sheet-reorder",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/sheets/<uuid:pk>/",
-        views.StudioApiSheetDetailView.as_view(),
-        name="api-sheet-detail",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/sheets/<uuid:pk>/split/",
-        views.StudioApiSheetSplitView.as_view(),
-        name="api-sheet-split",
-    ),
-    path(
-        "editor/api/content/<slug:content_type>/<slug:slug>/sheets/<uuid:pk>/merge-next/",
-        views.StudioApiSheetMergeView.as_view(),
-        name="api-sheet-merge-next",
-    ),
+        # -------------------------------------------------------------------
+        # Sheets (Batch 16: Ulysses-style sub-documents)
+        # -------------------------------------------------------------------
+        path(
+            "content/<slug:content_type>/<slug:slug>/sheets/",
+            views.StudioApiSheetListView.as_view(),
+            name="api-sheet-list",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/sheets/reorder/",
+            views.StudioApiSheetReorderView.as_view(),
+            name="api-sheet-reorder",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/sheets/<uuid:pk>/",
+            views.StudioApiSheetDetailView.as_view(),
+            name="api-sheet-detail",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/sheets/<uuid:pk>/split/",
+            views.StudioApiSheetSplitView.as_view(),
+            name="api-sheet-split",
+        ),
+        path(
+            "content/<slug:content_type>/<slug:slug>/sheets/<uuid:pk>/merge-next/",
+            views.StudioApiSheetMergeView.as_view(),
+            name="api-sheet-merge-next",
+        ),
 
-    # -----------------------------------------------------------------------
-    # ML Analysis API (proxies to Index-API)
-    # -----------------------------------------------------------------------
-    path(
-        "editor/api/ml/draft-connections/",
-        views.StudioApiDraftConnectionsView.as_view(),
-        name="api-draft-connections",
-    ),
-    path(
-        "editor/api/ml/similar-text/",
-        views.StudioApiSimilarTextView.as_view(),
-        name="api-similar-text",
-    ),
-    path(
-        "editor/api/ml/claim-audit/",
-        views.StudioApiClaimAuditView.as_view(),
-        name="api-claim-audit",
-    ),
-    path(
-        "editor/api/ml/extract-entities/",
-        views.StudioApiExtractEntitiesView.as_view(),
-        name="api-extract-entities",
-    ),
+        # -------------------------------------------------------------------
+        # ML Analysis API (proxies to Index-API)
+        # -------------------------------------------------------------------
+        path(
+            "ml/draft-connections/",
+            views.StudioApiDraftConnectionsView.as_view(),
+            name="api-draft-connections",
+        ),
+        path(
+            "ml/similar-text/",
+            views.StudioApiSimilarTextView.as_view(),
+            name="api-similar-text",
+        ),
+        path(
+            "ml/claim-audit/",
+            views.StudioApiClaimAuditView.as_view(),
+            name="api-claim-audit",
+        ),
+        path(
+            "ml/extract-entities/",
+            views.StudioApiExtractEntitiesView.as_view(),
+            name="api-extract-entities",
+        ),
 
-    # -----------------------------------------------------------------------
-    # Sourcebox JSON API (for Next.js Studio frontend)
-    # -----------------------------------------------------------------------
-    path(
-        "editor/api/sourcebox/",
-        views.StudioApiSourceboxListView.as_view(),
-        name="api-sourcebox-list",
-    ),
-    path(
-        "editor/api/sourcebox/capture/",
-        views.StudioApiSourceboxCaptureView.as_view(),
-        name="api-sourcebox-capture",
-    ),
-    path(
-        "editor/api/sourcebox/status/<int:pk>/",
-        views.StudioApiSourceboxStatusView.as_view(),
-        name="api-sourcebox-status",
-    ),
+        # -------------------------------------------------------------------
+        # Sourcebox JSON API (for Next.js Studio frontend)
+        # -------------------------------------------------------------------
+        path(
+            "sourcebox/",
+            views.StudioApiSourceboxListView.as_view(),
+            name="api-sourcebox-list",
+        ),
+        path(
+            "sourcebox/capture/",
+            views.StudioApiSourceboxCaptureView.as_view(),
+            name="api-sourcebox-capture",
+        ),
+        path(
+            "sourcebox/status/<int:pk>/",
+            views.StudioApiSourceboxStatusView.as_view(),
+            name="api-sourcebox-status",
+        ),
+    ])),
 ]
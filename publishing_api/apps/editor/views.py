@@ -29,6 +29,7 @@ import difflib
 import json
 import logging
 import os
+import re
 import traceback
 from collections import defaultdict
 from datetime import timedelta
@@ -36,7 +37,8 @@ from datetime import timedelta
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.core.exceptions import FieldDoesNotExist
 from django.http import Http404, JsonResponse
-from django.db.models import Count, Max, Sum
+from django.db import transaction
+from django.db.models import Count, F, Max, Q, Sum
 from django.db.models.functions import TruncDate
 from django.shortcuts import get_object_or_404, redirect, render
 from django.utils.decorators import method_decorator
@@ -51,6 +53,7 @@ from django.views.generic import CreateView, ListView, TemplateView, UpdateView
 logger = logging.getLogger(__name__)
 
 from apps.content.models import (
+    VIDEO_PHASE_INDEX,
     ContentRevision,
     ContentTask,
     DesignTokenSet,
@@ -126,11 +129,19 @@ def _publish_error(request, redirect_url, exc):
             "success": False,
             "commit_sha": "",
             "commit_url": "",
-            "error": traceback.format_exc().splitlines()[-1],
+            "error": traceback.format_exception_only(exc)[-1].strip(),
         })
     return redirect(redirect_url)
 
 
+def _recent_publishes(content_type, slug=None):
+    """Last five publish log rows for an edit page's history panel."""
+    logs = PublishLog.objects.filter(content_type=content_type)
+    if slug is not None:
+        logs = logs.filter(content_slug=slug)
+    return logs.only("commit_sha", "commit_url", "success", "created_at")[:5]
+
+
 # Maps URL content type slugs to model and stage field name.
 # Used by DeleteContentView and SetStageView.
 CONTENT_REGISTRY = {
@@ -142,6 +153,15 @@ CONTENT_REGISTRY = {
     "video": {"model": VideoProject, "stage_field": "phase"},
 }
 
+# Valid stage values per content type, read from each stage field's choices
+_STAGE_VALUES = {
+    content_type: frozenset(
+        value
+        for value, _label in reg["model"]._meta.get_field(reg["stage_field"]).choices
+    )
+    for content_type, reg in CONTENT_REGISTRY.items()
+}
+
 # Icon name + brand color for each content type. Used in list/edit headers
 # and dashboard cards. Colors match the section color language from the
 # Next.js frontend (terracotta=essays, teal=notes, gold=shelf/projects).
@@ -156,6 +176,36 @@ CONTENT_META = {
 }
 
 
+class _ContentListView(LoginRequiredMixin, ListView):
+    """
+    Shared list page for the content types. Subclasses set the model,
+    the CONTENT_META key, the URL name prefix and the display strings.
+    """
+
+    template_name = "editor/content_list.html"
+    context_object_name = "items"
+    content_type = ""
+    url_prefix = ""
+    content_type_plural = ""
+    content_type_display = ""
+    empty_title = ""
+    empty_description = ""
+
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        meta = CONTENT_META[self.content_type]
+        ctx["content_type"] = self.content_type
+        ctx["content_type_plural"] = self.content_type_plural
+        ctx["content_type_display"] = self.content_type_display
+        ctx["new_url"] = reverse(f"editor:{self.url_prefix}-create")
+        ctx["edit_url_name"] = f"editor:{self.url_prefix}-edit"
+        ctx["content_icon"] = meta["icon"]
+        ctx["content_color"] = meta["color"]
+        ctx["empty_title"] = self.empty_title
+        ctx["empty_description"] = self.empty_description
+        return ctx
+
+
 # ---------------------------------------------------------------------------
 # Dashboard
 # ---------------------------------------------------------------------------
@@ -166,20 +216,23 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
     def get_context_data(self, **kwargs):
         ctx = super().get_context_data(**kwargs)
-        _body = ("body", "composition")
+        # Cards and the activity feed only render these columns
+        _card = ("title", "slug", "updated_at", "draft")
 
         # ── Totals and draft counts ──────────────────────────────────
-        essay_total = Essay.objects.count()
-        note_total = FieldNote.objects.count()
+        # One aggregate per model returns both numbers in a single query.
+        def _total_and_drafts(model):
+            agg = model.objects.aggregate(
+                total=Count("pk"), drafts=Count("pk", filter=Q(draft=True)),
+            )
+            return agg["total"], agg["drafts"]
+
+        essay_total, essay_drafts = _total_and_drafts(Essay)
+        note_total, note_drafts = _total_and_drafts(FieldNote)
+        project_total, project_drafts = _total_and_drafts(Project)
+        video_total, video_drafts = _total_and_drafts(VideoProject)
         shelf_total = ShelfEntry.objects.count()
-        project_total = Project.objects.count()
         toolkit_total = ToolkitEntry.objects.count()
-        video_total = VideoProject.objects.count()
-
-        essay_drafts = Essay.objects.filter(draft=True).count()
-        note_drafts = FieldNote.objects.filter(draft=True).count()
-        project_drafts = Project.objects.filter(draft=True).count()
-        video_drafts = VideoProject.objects.filter(draft=True).count()
 
         ctx["totals"] = {
             "essays": essay_total,
@@ -220,70 +273,70 @@ class DashboardView(LoginRequiredMixin, TemplateView):
         candidates = []
         latest_essay = (
             Essay.objects.filter(draft=True)
-            .defer(*_body)
+            .values(*_card)
             .order_by("-updated_at")
             .first()
         )
         if latest_essay:
             candidates.append(
-                (latest_essay.updated_at, {
-                    "title": latest_essay.title,
-                    "url": reverse("editor:essay-edit", kwargs={"slug": latest_essay.slug}),
+                (latest_essay["updated_at"], {
+                    "title": latest_essay["title"],
+                    "url": reverse("editor:essay-edit", kwargs={"slug": latest_essay["slug"]}),
                     "type": "Essay",
                     "icon": "file-text",
                     "color": "#B45A2D",
-                    "date": latest_essay.updated_at,
+                    "date": latest_essay["updated_at"],
                 })
             )
         latest_note = (
             FieldNote.objects.filter(draft=True)
-            .defer(*_body)
+            .values(*_card)
             .order_by("-updated_at")
             .first()
         )
         if latest_note:
             candidates.append(
-                (latest_note.updated_at, {
-                    "title": latest_note.title,
-                    "url": reverse("editor:field-note-edit", kwargs={"slug": latest_note.slug}),
+                (latest_note["updated_at"], {
+                    "title": latest_note["title"],
+                    "url": reverse("editor:field-note-edit", kwargs={"slug": latest_note["slug"]}),
                     "type": "Field Note",
                     "icon": "note-pencil",
                     "color": "#2D5F6B",
-                    "date": latest_note.updated_at,
+                    "date": latest_note["updated_at"],
                 })
             )
         latest_project = (
             Project.objects.filter(draft=True)
-            .defer(*_body)
+            .values(*_card)
             .order_by("-updated_at")
             .first()
         )
         if latest_project:
             candidates.append(
-                (latest_project.updated_at, {
-                    "title": latest_project.title,
-                    "url": reverse("editor:project-edit", kwargs={"slug": latest_project.slug}),
+                (latest_project["updated_at"], {
+                    "title": latest_project["title"],
+                    "url": reverse("editor:project-edit", kwargs={"slug": latest_project["slug"]}),
                     "type": "Project",
                     "icon": "briefcase",
                     "color": "#C49A4A",
-                    "date": latest_project.updated_at,
+                    "date": latest_project["updated_at"],
                 })
             )
         latest_video = (
             VideoProject.objects.filter(draft=True)
-            .defer("script_body", "research_notes", "composition")
+            .values(*_card)
             .order_by("-updated_at")
             .first()
         )
         if latest_video:
             candidates.append(
-                (latest_video.updated_at, {
-                    "title": latest_video.title,
-                    "url": reverse("editor:video-edit", kwargs={"slug": latest_video.slug}),
+                (latest_video["updated_at"], {
+                    "title": latest_video["title"],
+                    "url": reverse("editor:video-edit", kwargs={"slug": latest_video["slug"]}),
                     "type": "Video",
                     "icon": "video-camera",
                     "color": "#5A7A4A",
-                    "date": latest_video.updated_at,
+                    "date": latest_video["updated_at"],
                 })
             )
         if candidates:
@@ -292,47 +345,45 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 
         # ── Activity timeline: 10 most recently touched items ────────
         activity = []
-        for essay in Essay.objects.defer(*_body).order_by("-updated_at")[:5]:
+        for essay in Essay.objects.values(*_card).order_by("-updated_at")[:5]:
             activity.append({
-                "title": essay.title,
-                "url": reverse("editor:essay-edit", kwargs={"slug": essay.slug}),
+                "title": essay["title"],
+                "url": reverse("editor:essay-edit", kwargs={"slug": essay["slug"]}),
                 "type": "Essay",
                 "icon": "file-text",
                 "color": "#B45A2D",
-                "date": essay.updated_at,
-                "draft": essay.draft,
+                "date": essay["updated_at"],
+                "draft": essay["draft"],
             })
-        for note in FieldNote.objects.defer(*_body).order_by("-updated_at")[:5]:
+        for note in FieldNote.objects.values(*_card).order_by("-updated_at")[:5]:
             activity.append({
-                "title": note.title,
-                "url": reverse("editor:field-note-edit", kwargs={"slug": note.slug}),
+                "title": note["title"],
+                "url": reverse("editor:field-note-edit", kwargs={"slug": note["slug"]}),
                 "type": "Field Note",
                 "icon": "note-pencil",
                 "color": "#2D5F6B",
-                "date": note.updated_at,
-                "draft": note.draft,
+                "date": note["updated_at"],
+                "draft": note["draft"],
             })
-        for proj in Project.objects.defer(*_body).order_by("-updated_at")[:3]:
+        for proj in Project.objects.values(*_card).order_by("-updated_at")[:3]:
             activity.append({
-                "title": proj.title,
-                "url": reverse("editor:project-edit", kwargs={"slug": proj.slug}),
+                "title": proj["title"],
+                "url": reverse("editor:project-edit", kwargs={"slug": proj["slug"]}),
                 "type": "Project",
                 "icon": "briefcase",
                 "color": "#C49A4A",
-                "date": proj.updated_at,
-                "draft": proj.draft,
+                "date": proj["updated_at"],
+                "draft": proj["draft"],
             })
-        for vid in VideoProject.objects.defer(
-            "script_body", "research_notes", "composition",
-        ).order_by("-updated_at")[:3]:
+        for vid in VideoProject.objects.values(*_card).order_by("-updated_at")[:3]:
             activity.append({
-                "title": vid.title,
-                "url": reverse("editor:video-edit", kwargs={"slug": vid.slug}),
+                "title": vid["title"],
+                "url": reverse("editor:video-edit", kwargs={"slug": vid["slug"]}),
                 "type": "Video",
                 "icon": "video-camera",
                 "color": "#5A7A4A",
-                "date": vid.updated_at,
-                "draft": vid.draft,
+                "date": vid["updated_at"],
+                "draft": vid["draft"],
             })
         activity.sort(key=lambda a: a["date"], reverse=True)
         ctx["activity"] = activity[:10]
@@ -349,25 +400,14 @@ class DashboardView(LoginRequiredMixin, TemplateView):
 # ---------------------------------------------------------------------------
 
 
-class EssayListView(LoginRequiredMixin, ListView):
+class EssayListView(_ContentListView):
     model = Essay
-    template_name = "editor/content_list.html"
-    context_object_name = "items"
-
-    def get_context_data(self, **kwargs):
-        ctx = super().get_context_data(**kwargs)
-        ctx["content_type"] = "essay"
-        ctx["content_type_plural"] = "Essays"
-        ctx["content_type_display"] = "Essay"
-        ctx["new_url"] = reverse("editor:essay-create")
-        ctx["edit_url_name"] = "editor:essay-edit"
-        ctx["content_icon"] = CONTENT_META["essay"]["icon"]
-        ctx["content_color"] = CONTENT_META["essay"]["color"]
-        ctx["empty_title"] = "No essays yet"
-        ctx["empty_description"] = (
-            "Start writing your first long-form investigation."
-        )
-        return ctx
+    content_type = "essay"
+    url_prefix = "essay"
+    content_type_plural = "Essays"
+    content_type_display = "Essay"
+    empty_title = "No essays yet"
+    empty_description = "Start writing your first long-form investigation."
 
 
 class EssayCreateView(LoginRequiredMixin, CreateView):
@@ -409,11 +449,9 @@ class EssayEditView(LoginRequiredMixin, UpdateView):
             "editor:set-stage",
             kwargs={"content_type": "essay", "slug": self.object.slug},
         )
-        ctx["stage_choices"] = json.dumps(self.object.stage_list)
+        ctx["stage_choices"] = self.object.STAGE_CHOICES_JSON
         ctx["current_stage"] = self.object.stage
-        ctx["recent_publishes"] = PublishLog.objects.filter(
-            content_type="essay", content_slug=self.object.slug
-        )[:5]
+        ctx["recent_publishes"] = _recent_publishes("essay", self.object.slug)
         return ctx
 
     def get_success_url(self):
@@ -428,9 +466,9 @@ class EssayPublishView(LoginRequiredMixin, View):
         redirect_url = reverse("editor:essay-edit", kwargs={"slug": slug})
         try:
             log = publish_essay(essay)
-        except Exception:
+        except Exception as exc:
             logger.exception("Publish failed for essay '%s'", slug)
-            return _publish_error(request, redirect_url, None)
+            return _publish_error(request, redirect_url, exc)
         return _publish_response(request, log, redirect_url)
 
 
@@ -439,25 +477,14 @@ class EssayPublishView(LoginRequiredMixin, View):
 # ---------------------------------------------------------------------------
 
 
-class FieldNoteListView(LoginRequiredMixin, ListView):
+class FieldNoteListView(_ContentListView):
     model = FieldNote
-    template_name = "editor/content_list.html"
-    context_object_name = "items"
-
-    def get_context_data(self, **kwargs):
-        ctx = super().get_context_data(**kwargs)
-        ctx["content_type"] = "field_note"
-        ctx["content_type_plural"] = "Field Notes"
-        ctx["content_type_display"] = "Field Note"
-        ctx["new_url"] = reverse("editor:field-note-create")
-        ctx["edit_url_name"] = "editor:field-note-edit"
-        ctx["content_icon"] = CONTENT_META["field_note"]["icon"]
-        ctx["content_color"] = CONTENT_META["field_note"]["color"]
-        ctx["empty_title"] = "No field notes yet"
-        ctx["empty_description"] = (
-            "Capture an observation or developing idea."
-        )
-        return ctx
+    content_type = "field_note"
+    url_prefix = "field-note"
+    content_type_plural = "Field Notes"
+    content_type_display = "Field Note"
+    empty_title = "No field notes yet"
+    empty_description = "Capture an observation or developing idea."
 
 
 class FieldNoteCreateView(LoginRequiredMixin, CreateView):
@@ -499,11 +526,9 @@ class FieldNoteEditView(LoginRequiredMixin, UpdateView):
             "editor:set-stage",
             kwargs={"content_type": "field-note", "slug": self.object.slug},
         )
-        ctx["stage_choices"] = json.dumps(self.object.stage_list)
+        ctx["stage_choices"] = self.object.STAGE_CHOICES_JSON
         ctx["current_stage"] = self.object.status
-        ctx["recent_publishes"] = PublishLog.objects.filter(
-            content_type="field_note", content_slug=self.object.slug
-        )[:5]
+        ctx["recent_publishes"] = _recent_publishes("field_note", self.object.slug)
         return ctx
 
     def get_success_url(self):
@@ -516,9 +541,9 @@ class FieldNotePublishView(LoginRequiredMixin, View):
         redirect_url = reverse("editor:field-note-edit", kwargs={"slug": slug})
         try:
             log = publish_field_note(note)
-        except Exception:
+        except Exception as exc:
             logger.exception("Publish failed for field note '%s'", slug)
-            return _publish_error(request, redirect_url, None)
+            return _publish_error(request, redirect_url, exc)
         return _publish_response(request, log, redirect_url)
 
 
@@ -527,25 +552,14 @@ class FieldNotePublishView(LoginRequiredMixin, View):
 # ---------------------------------------------------------------------------
 
 
-class ShelfListView(LoginRequiredMixin, ListView):
+class ShelfListView(_ContentListView):
     model = ShelfEntry
-    template_name = "editor/content_list.html"
-    context_object_name = "items"
-
-    def get_context_data(self, **kwargs):
-        ctx = super().get_context_data(**kwargs)
-        ctx["content_type"] = "shelf"
-        ctx["content_type_plural"] = "Shelf"
-        ctx["content_type_display"] = "Shelf Entry"
-        ctx["new_url"] = reverse("editor:shelf-create")
-        ctx["edit_url_name"] = "editor:shelf-edit"
-        ctx["content_icon"] = CONTENT_META["shelf"]["icon"]
-        ctx["content_color"] = CONTENT_META["shelf"]["color"]
-        ctx["empty_title"] = "Nothing on the shelf"
-        ctx["empty_description"] = (
-            "Add books, articles, and sources that inform your work."
-        )
-        return ctx
+    content_type = "shelf"
+    url_prefix = "shelf"
+    content_type_plural = "Shelf"
+    content_type_display = "Shelf Entry"
+    empty_title = "Nothing on the shelf"
+    empty_description = "Add books, articles, and sources that inform your work."
 
 
 class ShelfCreateView(LoginRequiredMixin, CreateView):
@@ -587,11 +601,9 @@ class ShelfEditView(LoginRequiredMixin, UpdateView):
             "editor:set-stage",
             kwargs={"content_type": "shelf", "slug": self.object.slug},
         )
-        ctx["stage_choices"] = json.dumps(self.object.stage_list)
+        ctx["stage_choices"] = self.object.STAGE_CHOICES_JSON
         ctx["current_stage"] = self.object.stage
-        ctx["recent_publishes"] = PublishLog.objects.filter(
-            content_type="shelf", content_slug=self.object.slug
-        )[:5]
+        ctx["recent_publishes"] = _recent_publishes("shelf", self.object.slug)
         return ctx
 
     def get_success_url(self):
@@ -604,9 +616,9 @@ class ShelfPublishView(LoginRequiredMixin, View):
         redirect_url = reverse("editor:shelf-edit", kwargs={"slug": slug})
         try:
             log = publish_shelf_entry(entry)
-        except Exception:
+        except Exception as exc:
             logger.exception("Publish failed for shelf entry '%s'", slug)
-            return _publish_error(request, redirect_url, None)
+            return _publish_error(request, redirect_url, exc)
         return _publish_response(request, log, redirect_url)
 
 
@@ -615,25 +627,14 @@ class ShelfPublishView(LoginRequiredMixin, View):
 # ---------------------------------------------------------------------------
 
 
-class ProjectListView(LoginRequiredMixin, ListView):
+class ProjectListView(_ContentListView):
     model = Project
-    template_name = "editor/content_list.html"
-    context_object_name = "items"
-
-    def get_context_data(self, **kwargs):
-        ctx = super().get_context_data(**kwargs)
-        ctx["content_type"] = "project"
-        ctx["content_type_plural"] = "Projects"
-        ctx["content_type_display"] = "Project"
-        ctx["new_url"] = reverse("editor:project-create")
-        ctx["edit_url_name"] = "editor:project-edit"
-        ctx["content_icon"] = CONTENT_META["project"]["icon"]
-        ctx["content_color"] = CONTENT_META["project"]["color"]
-        ctx["empty_title"] = "No projects yet"
-        ctx["empty_description"] = (
-            "Document the work you have built and organized."
-        )
-        return ctx
+    content_type = "project"
+    url_prefix = "project"
+    content_type_plural = "Projects"
+    content_type_display = "Project"
+    empty_title = "No projects yet"
+    empty_description = "Document the work you have built and organized."
 
 
 class ProjectCreateView(LoginRequiredMixin, CreateView):
@@ -675,11 +676,9 @@ class ProjectEditView(LoginRequiredMixin, UpdateView):
             "editor:set-stage",
             kwargs={"content_type": "project", "slug": self.object.slug},
         )
-        ctx["stage_choices"] = json.dumps(self.object.stage_list)
+        ctx["stage_choices"] = self.object.STAGE_CHOICES_JSON
         ctx["current_stage"] = self.object.stage
-        ctx["recent_publishes"] = PublishLog.objects.filter(
-            content_type="project", content_slug=self.object.slug
-        )[:5]
+        ctx["recent_publishes"] = _recent_publishes("project", self.object.slug)
         return ctx
 
     def get_success_url(self):
@@ -692,9 +691,9 @@ class ProjectPublishView(LoginRequiredMixin, View):
         redirect_url = reverse("editor:project-edit", kwargs={"slug": slug})
         try:
             log = publish_project(project)
-        except Exception:
+        except Exception as exc:
             logger.exception("Publish failed for project '%s'", slug)
-            return _publish_error(request, redirect_url, None)
+            return _publish_error(request, redirect_url, exc)
         return _publish_response(request, log, redirect_url)
 
 
@@ -703,25 +702,14 @@ class ProjectPublishView(LoginRequiredMixin, View):
 # ---------------------------------------------------------------------------
 
 
-class ToolkitListView(LoginRequiredMixin, ListView):
+class ToolkitListView(_ContentListView):
     model = ToolkitEntry
-    template_name = "editor/content_list.html"
-    context_object_name = "items"
-
-    def get_context_data(self, **kwargs):
-        ctx = super().get_context_data(**kwargs)
-        ctx["content_type"] = "toolkit"
-        ctx["content_type_plural"] = "Toolkit"
-        ctx["content_type_display"] = "Toolkit Entry"
-        ctx["new_url"] = reverse("editor:toolkit-create")
-        ctx["edit_url_name"] = "editor:toolkit-edit"
-        ctx["content_icon"] = CONTENT_META["toolkit"]["icon"]
-        ctx["content_color"] = CONTENT_META["toolkit"]["color"]
-        ctx["empty_title"] = "No toolkit entries yet"
-        ctx["empty_description"] = (
-            "Add a tool, technique, or resource to your workshop."
-        )
-        return ctx
+    content_type = "toolkit"
+    url_prefix = "toolkit"
+    content_type_plural = "Toolkit"
+    content_type_display = "Toolkit Entry"
+    empty_title = "No toolkit entries yet"
+    empty_description = "Add a tool, technique, or resource to your workshop."
 
 
 class ToolkitCreateView(LoginRequiredMixin, CreateView):
@@ -763,11 +751,9 @@ class ToolkitEditView(LoginRequiredMixin, UpdateView):
             "editor:set-stage",
             kwargs={"content_type": "toolkit", "slug": self.object.slug},
         )
-        ctx["stage_choices"] = json.dumps(self.object.stage_list)
+        ctx["stage_choices"] = self.object.STAGE_CHOICES_JSON
         ctx["current_stage"] = self.object.stage
-        ctx["recent_publishes"] = PublishLog.objects.filter(
-            content_type="toolkit", content_slug=self.object.slug
-        )[:5]
+        ctx["recent_publishes"] = _recent_publishes("toolkit", self.object.slug)
         return ctx
 
     def get_success_url(self):
@@ -780,9 +766,9 @@ class ToolkitPublishView(LoginRequiredMixin, View):
         redirect_url = reverse("editor:toolkit-edit", kwargs={"slug": slug})
         try:
             log = publish_toolkit_entry(entry)
-        except Exception:
+        except Exception as exc:
             logger.exception("Publish failed for toolkit entry '%s'", slug)
-            return _publish_error(request, redirect_url, None)
+            return _publish_error(request, redirect_url, exc)
         return _publish_response(request, log, redirect_url)
 
 
@@ -791,25 +777,14 @@ class ToolkitPublishView(LoginRequiredMixin, View):
 # ---------------------------------------------------------------------------
 
 
-class VideoListView(LoginRequiredMixin, ListView):
+class VideoListView(_ContentListView):
     model = VideoProject
-    template_name = "editor/content_list.html"
-    context_object_name = "items"
-
-    def get_context_data(self, **kwargs):
-        ctx = super().get_context_data(**kwargs)
-        ctx["content_type"] = "video"
-        ctx["content_type_plural"] = "Video Projects"
-        ctx["content_type_display"] = "Video Project"
-        ctx["new_url"] = reverse("editor:video-create")
-        ctx["edit_url_name"] = "editor:video-edit"
-        ctx["content_icon"] = CONTENT_META["video"]["icon"]
-        ctx["content_color"] = CONTENT_META["video"]["color"]
-        ctx["empty_title"] = "No video projects yet"
-        ctx["empty_description"] = (
-            "Start planning your first YouTube production."
-        )
-        return ctx
+    content_type = "video"
+    url_prefix = "video"
+    content_type_plural = "Video Projects"
+    content_type_display = "Video Project"
+    empty_title = "No video projects yet"
+    empty_description = "Start planning your first YouTube production."
 
 
 class VideoCreateView(LoginRequiredMixin, CreateView):
@@ -863,11 +838,9 @@ class VideoEditView(LoginRequiredMixin, UpdateView):
             "editor:video-set-phase",
             kwargs={"slug": self.object.slug},
         )
-        ctx["stage_choices"] = json.dumps(self.object.stage_list)
+        ctx["stage_choices"] = self.object.STAGE_CHOICES_JSON
         ctx["current_stage"] = self.object.phase
-        ctx["recent_publishes"] = PublishLog.objects.filter(
-            content_type="video", content_slug=self.object.slug
-        )[:5]
+        ctx["recent_publishes"] = _recent_publishes("video", self.object.slug)
         # Phase bar context: choices tuples + numeric indices for template
         ctx["phases"] = VideoProject.Phase.choices
         ctx["phase_number"] = self.object.phase_number
@@ -906,7 +879,7 @@ class VideoSetPhaseView(LoginRequiredMixin, View):
     POST-only endpoint: advance or roll back a video project's phase.
 
     Unlike the generic SetStageView, this enforces sequential advancement
-    and lock semantics via VideoProject.advance_phase() / rollback_phase().
+    and lock semantics via VideoProject.advance_phase_to() / rollback_phase_to().
 
     POST body (JSON): {"phase": "scripting"}
     Returns JSON with the updated phase and locked boundary.
@@ -923,36 +896,28 @@ class VideoSetPhaseView(LoginRequiredMixin, View):
         new_phase = data.get("phase", "")
 
         # Validate against the Phase choices
-        valid_phases = [c[0] for c in VideoProject.Phase.choices]
-        if new_phase not in valid_phases:
+        if new_phase not in VIDEO_PHASE_INDEX:
             return JsonResponse(
                 {"error": f"Invalid phase: {new_phase}"}, status=400
             )
 
         current_number = video.phase_number
-        target_number = list(dict(VideoProject.Phase.choices).keys()).index(
-            new_phase
-        )
+        target_number = VIDEO_PHASE_INDEX[new_phase]
 
         if target_number > current_number:
-            # Advancing: use advance_phase() which handles locks
-            if not video.can_advance:
+            # Advancing: advance_phase_to() locks every phase passed
+            if video.advance_phase_to(new_phase) is None:
                 return JsonResponse(
                     {"error": "Cannot advance: video is published."},
                     status=400,
                 )
-            # Advance one step at a time to respect sequential lock semantics
-            while video.phase_number < target_number:
-                video.advance_phase()
         elif target_number < current_number:
-            # Roll back one step at a time, respecting phase locks
-            while video.phase_number > target_number:
-                result = video.rollback_phase()
-                if result is None:
-                    return JsonResponse(
-                        {"error": f"Cannot roll back past locked phase: {video.phase}"},
-                        status=400,
-                    )
+            # Rolling back: refused if any phase on the way is locked
+            if video.rollback_phase_to(new_phase) is None:
+                return JsonResponse(
+                    {"error": f"Cannot roll back past locked phase: {video.phase_locked_through}"},
+                    status=400,
+                )
         # else: same phase, no-op
 
         # Best-effort TickTick priority sync
@@ -1004,13 +969,18 @@ class VideoSceneAddView(LoginRequiredMixin, View):
     """POST: create a new blank scene, return refreshed scenes panel."""
 
     def post(self, request, slug):
-        video = get_object_or_404(VideoProject, slug=slug)
-        max_order = video.scenes.aggregate(Max("order"))["order__max"] or 0
-        VideoScene.objects.create(
-            video=video,
-            order=max_order + 1,
-            title=f"Scene {max_order + 1}",
-        )
+        # Scenes are unique per (video, order). Locking the video row makes
+        # concurrent adds take turns reading MAX(order) and inserting.
+        with transaction.atomic():
+            video = get_object_or_404(
+                VideoProject.objects.select_for_update(), slug=slug
+            )
+            max_order = video.scenes.aggregate(Max("order"))["order__max"] or 0
+            VideoScene.objects.create(
+                video=video,
+                order=max_order + 1,
+                title=f"Scene {max_order + 1}",
+            )
         return _render_scenes_panel(request, video)
 
 
@@ -1018,11 +988,17 @@ class VideoSceneUpdateView(LoginRequiredMixin, View):
     """POST: update a scene via form data, return refreshed scenes panel."""
 
     def post(self, request, slug, pk):
-        video = get_object_or_404(VideoProject, slug=slug)
-        scene = get_object_or_404(VideoScene, pk=pk, video=video)
+        scene = get_object_or_404(
+            VideoScene.objects.select_related("video"), pk=pk, video__slug=slug
+        )
+        video = scene.video
         form = VideoSceneForm(request.POST, instance=scene)
-        if form.is_valid():
-            form.save()
+        if form.is_valid() and form.changed_data:
+            # Write only the edited columns; script stats follow script_text
+            update_fields = [*form.changed_data, "updated_at"]
+            if "script_text" in form.changed_data:
+                update_fields += ["word_count", "estimated_seconds"]
+            form.save(commit=False).save(update_fields=update_fields)
         return _render_scenes_panel(request, video)
 
 
@@ -1030,8 +1006,10 @@ class VideoSceneDeleteView(LoginRequiredMixin, View):
     """POST: delete a scene, return refreshed scenes panel."""
 
     def post(self, request, slug, pk):
-        video = get_object_or_404(VideoProject, slug=slug)
-        scene = get_object_or_404(VideoScene, pk=pk, video=video)
+        scene = get_object_or_404(
+            VideoScene.objects.select_related("video"), pk=pk, video__slug=slug
+        )
+        video = scene.video
         scene.delete()
         return _render_scenes_panel(request, video)
 
@@ -1041,14 +1019,20 @@ class VideoSceneToggleView(LoginRequiredMixin, View):
 
     def post(self, request, slug, pk):
         video = get_object_or_404(VideoProject, slug=slug)
-        scene = get_object_or_404(VideoScene, pk=pk, video=video)
         field = request.POST.get("field", "")
         toggleable = {
             "script_locked", "vo_recorded", "filmed", "assembled", "polished",
         }
+        scenes = VideoScene.objects.filter(pk=pk, video=video)
         if field in toggleable:
-            setattr(scene, field, not getattr(scene, field))
-            scene.save()
+            # Flip the flag in SQL: one UPDATE, no read-modify-write
+            updated = scenes.update(
+                **{field: ~F(field), "updated_at": timezone.now()}
+            )
+        else:
+            updated = scenes.exists()
+        if not updated:
+            raise Http404
         return _render_scenes_panel(request, video)
 
 
@@ -1069,8 +1053,10 @@ class VideoDeliverableUpdateView(LoginRequiredMixin, View):
     """POST: update a deliverable via form data."""
 
     def post(self, request, slug, pk):
-        video = get_object_or_404(VideoProject, slug=slug)
-        deliverable = get_object_or_404(VideoDeliverable, pk=pk, video=video)
+        deliverable = get_object_or_404(
+            VideoDeliverable.objects.select_related("video"), pk=pk, video__slug=slug
+        )
+        video = deliverable.video
         form = VideoDeliverableForm(request.POST, instance=deliverable)
         if form.is_valid():
             form.save()
@@ -1081,8 +1067,10 @@ class VideoDeliverableDeleteView(LoginRequiredMixin, View):
     """POST: delete a deliverable."""
 
     def post(self, request, slug, pk):
-        video = get_object_or_404(VideoProject, slug=slug)
-        deliverable = get_object_or_404(VideoDeliverable, pk=pk, video=video)
+        deliverable = get_object_or_404(
+            VideoDeliverable.objects.select_related("video"), pk=pk, video__slug=slug
+        )
+        video = deliverable.video
         deliverable.delete()
         return _render_deliverables_panel(request, video)
 
@@ -1104,8 +1092,10 @@ class VideoSessionStopView(LoginRequiredMixin, View):
     """POST: stop an active session, compute duration."""
 
     def post(self, request, slug, pk):
-        video = get_object_or_404(VideoProject, slug=slug)
-        session = get_object_or_404(VideoSession, pk=pk, video=video)
+        session = get_object_or_404(
+            VideoSession.objects.select_related("video"), pk=pk, video__slug=slug
+        )
+        video = session.video
         if not session.ended_at:
             session.ended_at = timezone.now()
             session.duration_minutes = int(
@@ -1136,9 +1126,7 @@ class NowPageEditView(LoginRequiredMixin, UpdateView):
         ctx = super().get_context_data(**kwargs)
         ctx["content_type"] = "now"
         ctx["publish_url"] = reverse("editor:now-publish")
-        ctx["recent_publishes"] = PublishLog.objects.filter(
-            content_type="now"
-        )[:5]
+        ctx["recent_publishes"] = _recent_publishes("now")
         return ctx
 
     def get_success_url(self):
@@ -1151,9 +1139,9 @@ class NowPagePublishView(LoginRequiredMixin, View):
         redirect_url = reverse("editor:now-edit")
         try:
             log = publish_now_page(now)
-        except Exception:
+        except Exception as exc:
             logger.exception("Publish failed for Now page")
-            return _publish_error(request, redirect_url, None)
+            return _publish_error(request, redirect_url, exc)
         return _publish_response(request, log, redirect_url)
 
 
@@ -1199,9 +1187,9 @@ class DeleteContentView(LoginRequiredMixin, View):
 
         try:
             log = delete_content(instance)
-        except Exception:
+        except Exception as exc:
             logger.exception("Delete failed for %s '%s'", content_type, slug)
-            return _publish_error(request, list_url, None)
+            return _publish_error(request, list_url, exc)
 
         return _publish_response(request, log, list_url)
 
@@ -1221,7 +1209,6 @@ class SetStageView(LoginRequiredMixin, View):
         reg = CONTENT_REGISTRY[content_type]
         model = reg["model"]
         field_name = reg["stage_field"]
-        instance = get_object_or_404(model, slug=slug)
 
         try:
             data = json.loads(request.body)
@@ -1231,18 +1218,17 @@ class SetStageView(LoginRequiredMixin, View):
         new_stage = data.get("stage", "")
 
         # Validate against the model's field choices
-        field = model._meta.get_field(field_name)
-        valid_values = [c[0] for c in field.choices]
-        if new_stage not in valid_values:
+        if new_stage not in _STAGE_VALUES[content_type]:
             return JsonResponse(
                 {"error": f"Invalid stage: {new_stage}"}, status=400
             )
 
-        setattr(instance, field_name, new_stage)
-        update_fields = [field_name]
-        if hasattr(instance, "updated_at"):
-            update_fields.append("updated_at")
-        instance.save(update_fields=update_fields)
+        # Single UPDATE by slug; no need to load the row first
+        changes = {field_name: new_stage}
+        if hasattr(model, "updated_at"):
+            changes["updated_at"] = timezone.now()
+        if not model.objects.filter(slug=slug).update(**changes):
+            raise Http404
 
         return JsonResponse({"stage": new_stage, "success": True})
 
@@ -1399,9 +1385,9 @@ class PublishSiteConfigView(LoginRequiredMixin, View):
         redirect_url = reverse("editor:site-settings")
         try:
             log = publish_site_config()
-        except Exception:
+        except Exception as exc:
             logger.exception("Publish failed for site configuration")
-            return _publish_error(request, redirect_url, None)
+            return _publish_error(request, redirect_url, exc)
         return _publish_response(request, log, redirect_url)
 
 
@@ -1502,6 +1488,9 @@ ALLOWED_IMAGE_TYPES = {
     "image/webp": ".webp",
 }
 
+# Runs of anything but lowercase letters and digits collapse to one hyphen
+_SAFE_NAME_RE = re.compile(r"[^a-z0-9]+")
+
 
 class UploadCollageImageView(LoginRequiredMixin, View):
     """
@@ -1514,8 +1503,6 @@ class UploadCollageImageView(LoginRequiredMixin, View):
     """
 
     def post(self, request):
-        import re
-
         uploaded = request.FILES.get("image")
         if not uploaded:
             return JsonResponse({"error": "No image file provided."}, status=400)
@@ -1539,7 +1526,7 @@ class UploadCollageImageView(LoginRequiredMixin, View):
 
         # Sanitize filename: lowercase, alphanumeric + hyphens only, force correct extension
         base_name = uploaded.name.rsplit(".", 1)[0] if "." in uploaded.name else uploaded.name
-        safe_name = re.sub(r"[^a-z0-9]+", "-", base_name.lower()).strip("-")
+        safe_name = _SAFE_NAME_RE.sub("-", base_name.lower()).strip("-")
         if not safe_name:
             safe_name = "fragment"
         ext = ALLOWED_IMAGE_TYPES[content_type]
@@ -1574,7 +1561,6 @@ class RemoveBackgroundView(LoginRequiredMixin, View):
     """POST: accept an image, remove background with rembg, commit cutout PNG to repo."""
 
     def post(self, request):
-        import re
         import io
 
         uploaded = request.FILES.get("image")
@@ -1602,7 +1588,7 @@ class RemoveBackgroundView(LoginRequiredMixin, View):
             raw_bytes = buf.getvalue()
 
             base_name = uploaded.name.rsplit(".", 1)[0] if "." in uploaded.name else uploaded.name
-            safe_name = re.sub(r"[^a-z0-9]+", "-", base_name.lower()).strip("-")
+            safe_name = _SAFE_NAME_RE.sub("-", base_name.lower()).strip("-")
             if not safe_name:
                 safe_name = "cutout"
             filename = f"{safe_name}.png"
@@ -2949,8 +2935,6 @@ class StudioApiContentCreateView(StudioApiBaseView):
 
 def _sync_editor_mentions(content_type: str, slug: str, body: str):
     """Extract @mention references from editor content and sync to EditorMention model."""
-    import re
-
     pattern = r'data-mention-id="([^"]+)"'
     matches = re.findall(pattern, body)
 
@@ -3952,7 +3936,7 @@ class StudioApiContentPublishView(StudioApiBaseView):
                 "success": False,
                 "commit_sha": "",
                 "commit_url": "",
-                "error": traceback.format_exc().splitlines()[-1],
+                "error": traceback.format_exception_only(exc)[-1].strip(),
             }, status=500)
 
         return self._json(request, {
@@ -11,6 +11,8 @@ annotations, urls, and callouts.
 """
 
 import json
+import sys
+from types import MappingProxyType
 
 from django import forms
 from django.utils.html import escape
@@ -92,6 +94,41 @@ class SlugListWidget(forms.TextInput):
         return json.dumps(slugs)
 
 
+# Borderless, transparent monospace textarea styling shared by the editor
+# body and the scene script fields; callers prepend size and padding.
+BARE_TEXTAREA_CLS = (
+    "leading-relaxed text-ink bg-transparent border-none"
+    " outline-none resize-y placeholder:text-ink-muted"
+)
+
+
+class EditorBodyTextarea(forms.Textarea):
+    """
+    The split-pane editor's main markdown textarea.
+
+    Always rendered with id="editor-body": studio.js binds the markdown
+    toolbar and tab indent to that id, and edit.html wires the preview
+    pane to it. Only the placeholder and minimum height vary per form.
+    """
+
+    _BODY_CLS = (
+        "w-full min-h-[{min_height}] px-6 py-4 font-mono text-[14px] "
+        + BARE_TEXTAREA_CLS
+    )
+
+    def __init__(self, attrs=None, placeholder="Start writing...", min_height="400px"):
+        defaults = {
+            "id": "editor-body",
+            "placeholder": placeholder,
+            # Formatted at runtime, so intern it: every form sharing a
+            # min_height then shares one class string
+            "class": sys.intern(self._BODY_CLS.format(min_height=min_height)),
+        }
+        if attrs:
+            defaults.update(attrs)
+        super().__init__(attrs=defaults)
+
+
 class JsonObjectListWidget(forms.Textarea):
     """
     Renders a JSON array of objects as pretty-printed JSON in a textarea.
@@ -130,40 +167,108 @@ class JsonObjectListWidget(forms.Textarea):
         return str(value)
 
     def value_from_datadict(self, data, files, name):
-        """Validate and return JSON string from the textarea."""
+        """Return the raw JSON string from the textarea."""
         raw = super().value_from_datadict(data, files, name)
         if not raw or not raw.strip():
             return "[]"
-        # Validate it parses as JSON; if not, return raw and let
-        # the form's clean method handle the error
-        try:
-            json.loads(raw)
-        except json.JSONDecodeError:
-            pass
+        # No parse here: forms.JSONField.to_python parses the string once
+        # and raises "Enter a valid JSON." itself if it is malformed
         return raw
 
 
+# Placeholder hints for JsonObjectListWidget fields, passed as
+# placeholder_hint= where the forms declare their widgets.
+DESIGN_COLORS_HINT = (
+    '{\n'
+    '  "terracotta": "#B45A2D",\n'
+    '  "teal": "#2D5F6B",\n'
+    '  "gold": "#C49A4A",\n'
+    '  "green": "#5A7A4A",\n'
+    '  "parchment": "#F5F0E8",\n'
+    '  "darkGround": "#2A2824",\n'
+    '  "cream": "#F0EBE3"\n'
+    '}'
+)
+
+DESIGN_FONTS_HINT = (
+    '{\n'
+    '  "title": "Vollkorn",\n'
+    '  "body": "Cabin",\n'
+    '  "mono": "Courier Prime",\n'
+    '  "annotation": "Caveat",\n'
+    '  "tagline": "Ysabeau"\n'
+    '}'
+)
+
+DESIGN_SPACING_HINT = (
+    '{\n'
+    '  "contentMaxWidth": "896px",\n'
+    '  "heroMaxWidth": "1152px"\n'
+    '}'
+)
+
+DESIGN_SECTION_COLORS_HINT = (
+    '{\n'
+    '  "essays": "terracotta",\n'
+    '  "fieldNotes": "teal",\n'
+    '  "projects": "gold"\n'
+    '}'
+)
+
+SITE_TOGGLES_HINT = (
+    '{\n'
+    '  "dotgrid_enabled": true,\n'
+    '  "paper_grain_enabled": true,\n'
+    '  "console_easter_egg": true\n'
+    '}'
+)
+
+PAGE_SETTINGS_HINT = '{\n  "key": "value"\n}'
+
+FIELD_NOTE_COMPOSITION_HINT = '{\n  "layout": "compact"\n}'
+
+PROJECT_COMPOSITION_HINT = '{\n  "tint": "teal"\n}'
+
+EMPTY_COMPOSITION_HINT = '{}'
+
+
 # ---------------------------------------------------------------------------
 # StructuredListWidget: row-based UI for JSON arrays of objects
 # ---------------------------------------------------------------------------
 
+
+def _freeze_schema(*field_defs):
+    """
+    Freeze a schema into a tuple of read-only mappings.
+
+    Schemas are module-level constants shared by every widget instance
+    (and every form instance), so they must never be mutated in place.
+    """
+    frozen = []
+    for field_def in field_defs:
+        if "options" in field_def:
+            field_def = {**field_def, "options": tuple(field_def["options"])}
+        frozen.append(MappingProxyType(field_def))
+    return tuple(frozen)
+
+
 # Pre-defined schemas for common JSON field types
-SOURCES_SCHEMA = [
+SOURCES_SCHEMA = _freeze_schema(
     {"name": "title", "type": "text", "label": "Title", "placeholder": "Source name"},
     {"name": "url", "type": "text", "label": "URL", "placeholder": "https://..."},
-]
+)
 
-ANNOTATIONS_SCHEMA = [
+ANNOTATIONS_SCHEMA = _freeze_schema(
     {"name": "paragraph", "type": "number", "label": "Paragraph #", "placeholder": "1"},
     {"name": "text", "type": "textarea", "label": "Note", "placeholder": "Margin annotation text..."},
-]
+)
 
-URLS_SCHEMA = [
+URLS_SCHEMA = _freeze_schema(
     {"name": "label", "type": "text", "label": "Label", "placeholder": "Live Site"},
     {"name": "url", "type": "text", "label": "URL", "placeholder": "https://..."},
-]
+)
 
-CALLOUTS_SCHEMA = [
+CALLOUTS_SCHEMA = _freeze_schema(
     {"name": "text", "type": "text", "label": "Text", "placeholder": "Callout text..."},
     {
         "name": "side",
@@ -171,26 +276,26 @@ CALLOUTS_SCHEMA = [
         "label": "Side",
         "options": [("right", "Right"), ("left", "Left")],
     },
-]
+)
 
-FOOTER_LINKS_SCHEMA = [
+FOOTER_LINKS_SCHEMA = _freeze_schema(
     {"name": "label", "type": "text", "label": "Label", "placeholder": "Link text"},
     {"name": "url", "type": "text", "label": "URL", "placeholder": "https://..."},
-]
+)
 
-VIDEO_SOURCES_SCHEMA = [
+VIDEO_SOURCES_SCHEMA = _freeze_schema(
     {"name": "title", "type": "text", "label": "Title", "placeholder": "Source name"},
     {"name": "url", "type": "text", "label": "URL", "placeholder": "https://..."},
     {"name": "type", "type": "text", "label": "Type", "placeholder": "article, book, video..."},
     {"name": "role", "type": "text", "label": "Role", "placeholder": "primary, background..."},
-]
+)
 
-YOUTUBE_CHAPTERS_SCHEMA = [
+YOUTUBE_CHAPTERS_SCHEMA = _freeze_schema(
     {"name": "timecode", "type": "text", "label": "Timecode", "placeholder": "0:00"},
     {"name": "label", "type": "text", "label": "Label", "placeholder": "Chapter title"},
-]
+)
 
-COLLAGE_FRAGMENTS_SCHEMA = [
+COLLAGE_FRAGMENTS_SCHEMA = _freeze_schema(
     {"name": "src", "type": "text", "label": "Image Path", "placeholder": "/collage/filename.png"},
     {"name": "alt", "type": "text", "label": "Alt Text", "placeholder": "Description of image"},
     {"name": "width", "type": "number", "label": "Width", "placeholder": "280"},
@@ -199,7 +304,14 @@ COLLAGE_FRAGMENTS_SCHEMA = [
     {"name": "top", "type": "number", "label": "Top Offset", "placeholder": "-10"},
     {"name": "rotate", "type": "number", "label": "Rotation (deg)", "placeholder": "-2"},
     {"name": "z", "type": "number", "label": "Z-Index", "placeholder": "2"},
-]
+)
+
+
+def _submit_plan(fields_schema):
+    return tuple(
+        (field_def["name"], field_def.get("type") == "number")
+        for field_def in fields_schema
+    )
 
 
 class StructuredListWidget(forms.Widget):
@@ -210,16 +322,38 @@ class StructuredListWidget(forms.Widget):
     and x Remove buttons. The JS in studio.js handles add/remove
     by cloning the <template> row and re-indexing on remove.
 
-    Constructor takes a fields_schema: list of dicts, each with:
+    fields_schema is a sequence of mappings, each with:
         name:        field key in the JSON object
         type:        'text' | 'number' | 'textarea' | 'select'
         label:       display label
         placeholder: (optional) placeholder text
-        options:     (optional, for select) list of (value, label) tuples
+        options:     (optional, for select) sequence of (value, label) pairs
+
+    Subclasses set fields_schema as a class attribute so the schema is
+    shared across instances instead of being attached to each widget.
+    Passing fields_schema to the constructor still works for one-off
+    schemas.
     """
 
-    def __init__(self, fields_schema, attrs=None):
-        self.fields_schema = fields_schema
+    fields_schema = ()
+    # (name, is_number) per schema field, derived once from fields_schema
+    # so value_from_datadict does not re-read the schema for every row
+    _submit_plan = ()
+
+    # Static row HTML per schema field, from _build_row_plan
+    _row_plan = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if "fields_schema" in cls.__dict__:
+            cls._submit_plan = _submit_plan(cls.fields_schema)
+            cls._row_plan = cls._build_row_plan(cls.fields_schema)
+
+    def __init__(self, fields_schema=None, attrs=None):
+        if fields_schema is not None:
+            self.fields_schema = fields_schema
+            self._submit_plan = _submit_plan(fields_schema)
+            self._row_plan = self._build_row_plan(fields_schema)
         super().__init__(attrs=attrs or {})
 
     def render(self, name, value, attrs=None, renderer=None):
@@ -266,70 +400,87 @@ class StructuredListWidget(forms.Widget):
         "block font-mono text-[10px] uppercase tracking-wider text-ink-muted mb-1"
     )
 
-    def _render_row(self, name, index, item):
-        parts = [
-            f'<div class="flex flex-wrap items-start gap-3 p-3 bg-cream '
-            f'rounded-brand border border-border/50 relative group" '
-            f'data-index="{index}">'
-        ]
+    _ROW_REMOVE_BUTTON = (
+        '<button type="button" class="absolute top-2 right-2 text-ink-muted '
+        "hover:text-error bg-transparent border-none cursor-pointer text-lg "
+        'leading-none opacity-0 group-hover:opacity-100 transition-opacity" '
+        'title="Remove">&times;</button>'
+    )
 
-        for field_def in self.fields_schema:
+    @classmethod
+    def _build_row_plan(cls, fields_schema):
+        """
+        Pre-render the static HTML around each schema field.
+
+        Returns one (field_name, head, middle, tail, options) tuple per
+        field. A rendered field is head + escaped row prefix + middle +
+        escaped value (or the option tags, for selects) + tail, so
+        _render_row only escapes what varies per row.
+        """
+        plan = []
+        for field_def in fields_schema:
             field_name = field_def["name"]
             field_type = field_def.get("type", "text")
             label = field_def.get("label", field_name.title())
-            placeholder = field_def.get("placeholder", "")
-            raw_value = item.get(field_name, "") if isinstance(item, dict) else ""
-            input_name = f"{name}__{index}__{field_name}"
-
-            parts.append('<div class="flex-1 min-w-[120px]">')
-            parts.append(
-                f'<label class="{self._LABEL_CLS}">{escape(label)}</label>'
-            )
+            placeholder = escape(field_def.get("placeholder", ""))
+            options = None
 
             if field_type == "textarea":
-                parts.append(
-                    f'<textarea name="{escape(input_name)}" '
-                    f'class="{self._INPUT_CLS} resize-y min-h-[60px]" '
-                    f'placeholder="{escape(placeholder)}" rows="2">'
-                    f"{escape(str(raw_value))}</textarea>"
-                )
-            elif field_type == "number":
-                parts.append(
-                    f'<input type="number" name="{escape(input_name)}" '
-                    f'class="{self._INPUT_CLS}" '
-                    f'value="{escape(str(raw_value))}" '
-                    f'placeholder="{escape(placeholder)}">'
+                head = "<textarea"
+                middle = (
+                    f'" class="{cls._INPUT_CLS} resize-y min-h-[60px]" '
+                    f'placeholder="{placeholder}" rows="2">'
                 )
+                tail = "</textarea>"
             elif field_type == "select":
-                options = field_def.get("options", [])
-                opts_html = []
-                for opt_val, opt_label in options:
-                    selected = " selected" if str(raw_value) == str(opt_val) else ""
-                    opts_html.append(
-                        f'<option value="{escape(str(opt_val))}"{selected}>'
-                        f"{escape(opt_label)}</option>"
+                head = "<select"
+                middle = f'" class="{cls._INPUT_CLS} appearance-none cursor-pointer">'
+                tail = "</select>"
+                options = tuple(
+                    (
+                        str(opt_val),
+                        f'<option value="{escape(str(opt_val))}"',
+                        f">{escape(opt_label)}</option>",
                     )
-                parts.append(
-                    f'<select name="{escape(input_name)}" '
-                    f'class="{self._INPUT_CLS} appearance-none cursor-pointer">'
-                    f'{"".join(opts_html)}</select>'
+                    for opt_val, opt_label in field_def.get("options", [])
                 )
             else:
-                parts.append(
-                    f'<input type="text" name="{escape(input_name)}" '
-                    f'class="{self._INPUT_CLS}" '
-                    f'value="{escape(str(raw_value))}" '
-                    f'placeholder="{escape(placeholder)}">'
-                )
+                input_type = "number" if field_type == "number" else "text"
+                head = f'<input type="{input_type}"'
+                middle = f'" class="{cls._INPUT_CLS}" value="'
+                tail = f'" placeholder="{placeholder}">'
+
+            head = (
+                '<div class="flex-1 min-w-[120px]">\n'
+                f'<label class="{cls._LABEL_CLS}">{escape(label)}</label>\n'
+                f'{head} name="'
+            )
+            middle = escape(field_name) + middle
+            plan.append((field_name, head, middle, tail + "\n</div>", options))
+        return tuple(plan)
 
-            parts.append("</div>")
+    def _render_row(self, name, index, item):
+        if not isinstance(item, dict):
+            item = {}
+        name_prefix = escape(f"{name}__{index}__")
 
-        parts.append(
-            '<button type="button" class="absolute top-2 right-2 text-ink-muted '
-            "hover:text-error bg-transparent border-none cursor-pointer text-lg "
-            'leading-none opacity-0 group-hover:opacity-100 transition-opacity" '
-            'title="Remove">&times;</button>'
-        )
+        parts = [
+            f'<div class="flex flex-wrap items-start gap-3 p-3 bg-cream '
+            f'rounded-brand border border-border/50 relative group" '
+            f'data-index="{index}">'
+        ]
+        for field_name, head, middle, tail, options in self._row_plan:
+            raw_value = str(item.get(field_name, ""))
+            if options is None:
+                value_html = escape(raw_value)
+            else:
+                value_html = "".join(
+                    f"{opt_open} selected{opt_close}" if raw_value == opt_val
+                    else f"{opt_open}{opt_close}"
+                    for opt_val, opt_open, opt_close in options
+                )
+            parts.append(f"{head}{name_prefix}{middle}{value_html}{tail}")
+        parts.append(self._ROW_REMOVE_BUTTON)
         parts.append("</div>")
         return "\n".join(parts)
 
@@ -350,22 +501,21 @@ class StructuredListWidget(forms.Widget):
         """Collect indexed fields from POST data, assemble into JSON array."""
         items = []
         index = 0
+        plan = self._submit_plan
 
         # Walk sequential indices; JS re-numbers rows on remove
-        first_field_name = self.fields_schema[0]["name"]
+        first_field_name = plan[0][0]
         while True:
-            probe_key = f"{name}__{index}__{first_field_name}"
-            if probe_key not in data:
+            row_prefix = f"{name}__{index}__"
+            if row_prefix + first_field_name not in data:
                 break
 
             item = {}
-            for field_def in self.fields_schema:
-                field_name = field_def["name"]
-                field_key = f"{name}__{index}__{field_name}"
-                val = data.get(field_key, "")
+            for field_name, is_number in plan:
+                val = data.get(row_prefix + field_name, "")
 
                 # Coerce number fields
-                if field_def.get("type") == "number" and val:
+                if is_number and val:
                     try:
                         val = int(val)
                     except ValueError:
@@ -385,6 +535,38 @@ class StructuredListWidget(forms.Widget):
         return json.dumps(items)
 
 
+class SourcesWidget(StructuredListWidget):
+    fields_schema = SOURCES_SCHEMA
+
+
+class AnnotationsWidget(StructuredListWidget):
+    fields_schema = ANNOTATIONS_SCHEMA
+
+
+class UrlsWidget(StructuredListWidget):
+    fields_schema = URLS_SCHEMA
+
+
+class CalloutsWidget(StructuredListWidget):
+    fields_schema = CALLOUTS_SCHEMA
+
+
+class FooterLinksWidget(StructuredListWidget):
+    fields_schema = FOOTER_LINKS_SCHEMA
+
+
+class VideoSourcesWidget(StructuredListWidget):
+    fields_schema = VIDEO_SOURCES_SCHEMA
+
+
+class YoutubeChaptersWidget(StructuredListWidget):
+    fields_schema = YOUTUBE_CHAPTERS_SCHEMA
+
+
+class CollageFragmentsWidget(StructuredListWidget):
+    fields_schema = COLLAGE_FRAGMENTS_SCHEMA
+
+
 # ---------------------------------------------------------------------------
 # CompositionWidget: heroStyle selector + conditional fragments editor
 # ---------------------------------------------------------------------------
@@ -415,10 +597,12 @@ class CompositionWidget(forms.Widget):
     Extra keys already in the composition dict are preserved on round-trip.
     """
 
+    # Stateless (render and value_from_datadict only read their arguments),
+    # so one instance is shared by every CompositionWidget rather than
+    # allocating and deep-copying a nested widget per form.
+    _fragments_widget = CollageFragmentsWidget()
+
     def __init__(self, attrs=None):
-        self._fragments_widget = StructuredListWidget(
-            fields_schema=COLLAGE_FRAGMENTS_SCHEMA
-        )
         super().__init__(attrs=attrs or {})
 
     # Shared Tailwind class strings for composition inputs
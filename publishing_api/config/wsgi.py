@@ -10,7 +10,23 @@ https://docs.djangoproject.com/en/6.0/howto/deployment/wsgi/
 import os
 
 from django.core.wsgi import get_wsgi_application
+from django.urls import get_resolver
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
 application = get_wsgi_application()
+
+
+def warm_url_resolver():
+    """
+    Populate the URL resolver while the worker boots.
+
+    Reading reverse_dict is what triggers the work: the first access builds
+    the reverse lookup tables, compiling every route regex along the way.
+    Doing it here keeps that cost out of whichever request first calls
+    reverse() or {% url %}.
+    """
+    get_resolver().reverse_dict
+
+
+warm_url_resolver()
@@ -6,6 +6,7 @@
  *   2. Autosave: debounced field-level saves
  *   3. Character counters, Tab indent, global shortcuts (Cmd+S, Cmd+Shift+P)
  *   4. Structured list widget: add/remove rows via <template> cloning
+ *   5. Formset rows: append formset.empty_form rows on demand
  */
 
 (function () {
@@ -333,6 +334,34 @@
         });
     }
 
+    // ─── 7. Formset rows: clone formset.empty_form from a <template> ───
+
+    function initFormsetRows() {
+        // Each formset page has:
+        //   <tbody data-formset-body="<prefix>">     existing rows
+        //   <template data-formset-template="<prefix>">  empty_form row (__prefix__)
+        //   a button with data-formset-add="<prefix>"
+        // Adding a row renumbers __prefix__ and bumps <prefix>-TOTAL_FORMS.
+
+        document.querySelectorAll('template[data-formset-template]').forEach(function (templateEl) {
+            var prefix = templateEl.dataset.formsetTemplate;
+            var body = document.querySelector('[data-formset-body="' + prefix + '"]');
+            var total = document.querySelector('input[name="' + prefix + '-TOTAL_FORMS"]');
+            var addBtn = document.querySelector('[data-formset-add="' + prefix + '"]');
+            if (!body || !total || !addBtn) return;
+
+            addBtn.addEventListener('click', function (e) {
+                e.preventDefault();
+                var idx = parseInt(total.value, 10) || 0;
+                body.insertAdjacentHTML(
+                    'beforeend',
+                    templateEl.innerHTML.replace(/__prefix__/g, idx)
+                );
+                total.value = idx + 1;
+            });
+        });
+    }
+
     // ─── Init ───────────────────────────────────────────────────────────
 
     document.addEventListener('DOMContentLoaded', function () {
@@ -342,5 +371,6 @@
         initTabIndent();
         initGlobalShortcuts();
         initStructuredLists();
+        initFormsetRows();
     });
 })();